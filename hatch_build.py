@@ -1,10 +1,35 @@
+import json
+import pkgutil
+import tempfile
 from pathlib import Path
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
 from hatchling.metadata.plugin.interface import MetadataHookInterface
 from pymodaq_utils.resources.hatch_build_plugins import update_metadata_from_toml
 
 here = Path(__file__).absolute().parent
 
+PLUGIN_SUBPACKAGES = ('daq_move_plugins',
+                      'daq_viewer_plugins.plugins_0D',
+                      'daq_viewer_plugins.plugins_1D',
+                      'daq_viewer_plugins.plugins_2D')
+
 
 class PluginInfoTomlHook(MetadataHookInterface):
     def update(self, metadata: dict) -> None:
         update_metadata_from_toml(metadata, here)
+
+
+class PluginIndexBuildHook(BuildHookInterface):
+    """Ship in the wheel the name -> module index of the plugin subpackages used by their lazy __getattr__"""
+
+    def initialize(self, version: str, build_data: dict) -> None:
+        package_name = self.metadata.name.replace('-', '_')
+        package_path = here.joinpath('src', package_name)
+        index = {}
+        for subpackage in PLUGIN_SUBPACKAGES:
+            folder = package_path.joinpath(*subpackage.split('.'))
+            index[subpackage] = sorted(mod.name for mod in pkgutil.iter_modules([str(folder)]))
+
+        index_file = Path(tempfile.mkdtemp()).joinpath('plugin_index.json')
+        index_file.write_text(json.dumps(index, indent=4))
+        build_data['force_include'][str(index_file)] = f'{package_name}/resources/plugin_index.json'
@@ -9,9 +9,15 @@ from pymodaq_gui.plotting.data_viewers.viewer1D import Viewer1D, DataToExport, D
 
 from pymodaq.control_modules.daq_viewer import DAQ_Viewer, DAQTypesEnum
 
+from pymodaq_plugins_teaching.processing.spectral import FFTMagnitude
+from pymodaq_plugins_teaching.processing.worker import AnalysisWorker
+from pymodaq_plugins_teaching.processing.display import DisplayThrottle
+
 
 class GenApp(CustomApp):
 
+    display_rate = 30.  # Hz, maximum refresh rate of the viewers, faster frames are coalesced
+
     params = [
         {'title': 'Frequency', 'name': 'frequency', 'type': 'slide', 'value': 50, 'default': 50, 'limits': (24, 123), 'subtype': 'linear'},
     ]
@@ -22,10 +28,15 @@ class GenApp(CustomApp):
 
         self.viewer1D_raw: Optional[Viewer1D] = None
         self.viewer1D_fft: Optional[Viewer1D] = None
+        self.display_raw: Optional[DisplayThrottle] = None
+        self.display_fft: Optional[DisplayThrottle] = None
 
         self.daq_viewer: Optional[DAQ_Viewer] = None
 
         self.dwa_raw: Optional[DataWithAxes] = None
+        self.dwa_fft: Optional[DataWithAxes] = None
+        self.fft = FFTMagnitude()
+        self.worker = AnalysisWorker(self.fft.process)
 
         self.setup_ui()
 
@@ -47,6 +58,8 @@ class GenApp(CustomApp):
 
         self.viewer1D_raw = Viewer1D(QtWidgets.QWidget())
         self.viewer1D_fft = Viewer1D(QtWidgets.QWidget())
+        self.display_raw = DisplayThrottle(self.viewer1D_raw, self.display_rate)
+        self.display_fft = DisplayThrottle(self.viewer1D_fft, self.display_rate)
 
         dockarea = DockArea()
         main_window = QtWidgets.QMainWindow()
@@ -79,6 +92,7 @@ class GenApp(CustomApp):
     def connect_things(self):
         # self.daq_viewer.grab_done_signal.connect(lambda dte: self.viewer1D_raw.show_data(dte[0]))
         self.daq_viewer.grab_done_signal.connect(self.get_dwa_and_show)
+        self.worker.result_ready.connect(self.show_analysis)
 
         self.connect_action('snap', self.daq_viewer.snap)
         self.connect_action('grab', self.daq_viewer.grab)
@@ -89,15 +103,23 @@ class GenApp(CustomApp):
 
     def get_dwa_and_show(self, dte=DataToExport):
         self.dwa_raw = dte[0]
-        self.viewer1D_raw.show_data(self.dwa_raw)
-
-        self.dwa_fft = self.dwa_raw.ft()
-        self.viewer1D_fft.show_data(abs(self.dwa_fft))
+        self.display_raw.show_data(self.dwa_raw)
+        self.worker.submit(self.dwa_raw)
+
+    def show_analysis(self):
+        dwa = self.worker.take_result()
+        if dwa is not None:
+            self.dwa_fft = dwa
+            self.display_fft.show_data(self.dwa_fft)
     
     def value_changed(self, param):
         if param.name() == "frequency":
             self.daq_viewer.settings.child('detector_settings', 'frequency').setValue(param.value())
 
+    def quit_fun(self):
+        self.worker.stop()
+        return super().quit_fun()
+
 def main():
     from pymodaq_gui.utils.utils import mkQApp
     from qtpy import QtWidgets
@@ -108,6 +130,7 @@ def main():
     win = QtWidgets.QMainWindow()
     win.setCentralWidget(area)
     gen_app = GenApp(area)
+    app.aboutToQuit.connect(gen_app.quit_fun)
     win.show()
     app.exec()
 
@@ -1,12 +1,9 @@
-import importlib
 from pathlib import Path
 from pymodaq.utils.logger import set_logger
+from pymodaq_plugins_teaching.plugin_index import lazy_plugins
 logger = set_logger('move_plugins', add_to_console=False)
 
-for path in Path(__file__).parent.iterdir():
-    try:
-        if '__init__' not in str(path):
-            importlib.import_module('.' + path.stem, __package__)
-    except Exception as e:
-        logger.warning("{:} plugin couldn't be loaded due to some missing packages or errors: {:}".format(path.stem, str(e)))
-        pass
+path = Path(__file__)  # PyMoDAQ lists the plugins using pkgutil.iter_modules([str(path.parent)])
+
+# plugin modules are only imported when accessed as attributes of this package
+__getattr__, __dir__ = lazy_plugins(__name__, logger)
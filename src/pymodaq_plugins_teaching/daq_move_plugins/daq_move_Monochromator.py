@@ -1,4 +1,8 @@
+import threading
 from typing import Union, List, Dict
+
+from qtpy import QtCore
+
 from pymodaq.control_modules.move_utility_classes import (DAQ_Move_base, comon_parameters_fun,
                                                           main, DataActuatorType, DataActuator)
 
@@ -48,9 +52,14 @@ class DAQ_Move_Monochromator(DAQ_Move_base):
     data_actuator_type = DataActuatorType.DataActuator  # whether you use the new data style for actuator otherwise set this
     # as  DataActuatorType.float  (or entirely remove the line)
 
+    arrived_signal = QtCore.Signal(object)  # emitted from the spectrometer timer thread with the completion event
+
     params = [
                  {'title': 'Info', 'name': 'info', 'type': 'str', 'value': ''},
-                 {'title': 'Grating', 'name': 'grating', 'type': 'list', 'limits': Spectrometer.gratings, 'value': Spectrometer.gratings[0]}
+                 {'title': 'Grating', 'name': 'grating', 'type': 'list', 'limits': Spectrometer.gratings, 'value': Spectrometer.gratings[0]},
+                 {'title': 'Heartbeat:', 'name': 'heartbeat', 'type': 'int', 'value': 500, 'min': 10, 'suffix': 'ms',
+                  'tip': 'Polling interval used to update the displayed value, the completion of the motion is '
+                         'signaled by the spectrometer'},
              ] + comon_parameters_fun(is_multiaxes, axis_names=_axis_names, epsilon=_epsilon)
 
     # _epsilon is the initial default value for the epsilon parameter allowing pymodaq to know if the controller reached
@@ -62,7 +71,7 @@ class DAQ_Move_Monochromator(DAQ_Move_base):
         self.controller: Spectrometer = None
 
         # TODO declare here attributes you want/need to init with a default value
-        pass
+        self._arrived = None  # completion event of the current motion
 
     def get_actuator_value(self):
         """Get the current value from the hardware with scaling conversion.
@@ -85,11 +94,23 @@ class DAQ_Move_Monochromator(DAQ_Move_base):
         -------
         bool: if True, PyMoDAQ considers the target value has been reached
         """
-        # TODO either delete this method if the usual polling is fine with you, but if need you can
-        #  add here some other condition to be fulfilled either a completely new one or
-        #  using or/and operations between the epsilon_bool and some other custom booleans
-        #  for a usage example see DAQ_Move_brushlessMotor from the ThorLabs plugin
-        return True
+        return self._arrived is None or self._arrived.is_set()
+
+    def on_arrived(self, arrived: threading.Event):
+        """Emit move_done as soon as the spectrometer signals the completion of the motion, without waiting for the
+        next heartbeat
+
+        Parameters
+        ----------
+        arrived: threading.Event
+            The completion event of the motion, ignored if it is not the current one (signal of a superseded motion
+            already queued when the new one started)
+        """
+        if arrived is not self._arrived:
+            return
+        if self.poll_timer.isActive():  # otherwise move_done has already been emitted (or the motion is not polled)
+            self.poll_timer.stop()
+            self.move_done()
 
     def close(self):
         """Terminate the communication protocol"""
@@ -108,6 +129,8 @@ class DAQ_Move_Monochromator(DAQ_Move_base):
 
         if param.name() == "grating":
             self.controller.grating = param.value()
+        elif param.name() == 'heartbeat':
+            self.poll_timer.setInterval(param.value())
         else:
             pass
 
@@ -135,6 +158,9 @@ class DAQ_Move_Monochromator(DAQ_Move_base):
 
         self.settings.child('info').setValue(self.controller.infos)
 
+        self.poll_timer.setInterval(self.settings['heartbeat'])
+        self.arrived_signal.connect(self.on_arrived)
+
         # A checker pour changer les valeurs initiales des boites verte et rouge (move_abs)
         # self.emit_status(ThreadCommand(ThreadStatus.UPDATE_UI, 'set_abs_value_green', args=(Q_('300 nm'), ))
 
@@ -152,8 +178,9 @@ class DAQ_Move_Monochromator(DAQ_Move_base):
         self.target_value = value
         value = self.set_position_with_scaling(value)  # apply scaling if the user specified one
         ## TODO for your custom plugin
-        self.controller.set_wavelength(value.value(self.axis_unit), set_type='abs')  # axis_unit ou 'nm' not to be
-                                                                                     # mixed up with axis_units
+        self._arrived = self.controller.set_wavelength(value.value(self.axis_unit), set_type='abs',
+                                                       callback=self.arrived_signal.emit, epsilon=self.epsilon)
+        # axis_unit ou 'nm' not to be mixed up with axis_units
         self.emit_status(ThreadCommand('Update_Status', ['Some info you want to log']))
 
     def move_rel(self, value: DataActuator):
@@ -168,13 +195,14 @@ class DAQ_Move_Monochromator(DAQ_Move_base):
         value = self.set_position_relative_with_scaling(value)
 
         ## TODO for your custom plugin
-        self.controller.set_wavelength(value.value('nm'), set_type='rel')  # when writing your own plugin replace this line
+        self._arrived = self.controller.set_wavelength(value.value('nm'), set_type='rel',
+                                                       callback=self.arrived_signal.emit, epsilon=self.epsilon)
         self.emit_status(ThreadCommand('Update_Status', ['Some info you want to log']))
 
     def move_home(self):
         """Call the reference method of the controller"""
 
-        self.controller.find_reference()
+        self._arrived = self.controller.find_reference(callback=self.arrived_signal.emit, epsilon=self.epsilon)
         self.emit_status(ThreadCommand('Update_Status', ['Some info you want to log']))
 
     def stop_motion(self):
@@ -182,6 +210,8 @@ class DAQ_Move_Monochromator(DAQ_Move_base):
 
         ## TODO for your custom plugin
         self.controller.stop()  # when writing your own plugin replace this line
+        self.poll_timer.stop()
+        self.move_done()
         self.emit_status(ThreadCommand('Update_Status', ['Some info you want to log']))
 
 
@@ -1,4 +1,7 @@
+from time import perf_counter
+
 import numpy as np
+from qtpy import QtWidgets
 
 from pymodaq_utils.utils import ThreadCommand
 from pymodaq_data.data import DataToExport
@@ -39,10 +42,12 @@ class DAQ_0DViewer_Photodiode(DAQ_Viewer_base):
 
     """
 
-    # live_mode_available = True  # Handle grab directly within plugin and not through GUI
+    live_mode_available = True  # Handle grab directly within plugin and not through GUI
+    hardware_averaging = True  # Naverage samples are averaged by the spectrometer
 
     params = comon_parameters+[
-        ## TODO for your custom plugin: elements to be added here as dicts in order to control your custom stage
+        {'title': 'Display rate:', 'name': 'display_rate', 'type': 'float', 'value': 20., 'min': 0.1,
+         'suffix': 'Hz', 'tip': 'In live mode, samples are acquired continuously and their mean emitted at this rate'},
         ]
 
     def ini_attributes(self):
@@ -50,8 +55,7 @@ class DAQ_0DViewer_Photodiode(DAQ_Viewer_base):
         #  autocompletion
         self.controller: Spectrometer = None
 
-        #TODO declare here attributes you want/need to init with a default value
-        pass
+        self._live = False
 
     def commit_settings(self, param: Parameter):
         """Apply the consequences of a change of value in the detector settings
@@ -108,21 +112,47 @@ class DAQ_0DViewer_Photodiode(DAQ_Viewer_base):
         if self.is_master:  # To specify for avoiding slave closing connection issue
             self.controller.close_communication()  # when writing your own plugin replace this line
 
-    def grab_data(self, Naverage=1, **kwargs):
+    def grab_data(self, Naverage=1, live=False, **kwargs):
         """Start a grab from the detector
 
         Parameters
         ----------
         Naverage: int
-            Number of hardware averaging (if hardware averaging is possible, self.hardware_averaging should be set to
-            True in class preamble and you should code this implementation)
+            Number of samples averaged before emission (at least, in live mode)
+        live: bool
+            If True, acquire continuously until stopped, emitting at the display rate the mean of the samples
+            acquired during the display period (at least Naverage of them)
         kwargs: dict
             others optionals arguments
         """
-        ## TODO for your custom plugin: you should choose EITHER the synchrone or the asynchrone version following
+        if live:
+            self._live = True
+            while self._live:
+                self.emit_data(self._grab_block(Naverage, 1 / self.settings['display_rate']))
+                QtWidgets.QApplication.processEvents()  # to get the stop command
+        else:
+            # synchron version (blocking function)
+            self.emit_data(self._grab_block(Naverage))
+
+    def _grab_block(self, n_samples: int, duration: float = 0.) -> np.ndarray:
+        """Acquire samples by batches of n_samples, averaged by the spectrometer, until at least n_samples samples
+        are acquired and for at least duration (in s), and return their mean"""
+        total = 0.
+        n_batches = 0
+        end = perf_counter() + duration
+        while n_batches == 0 or perf_counter() < end:
+            total += self.controller.grab_monochromator_average(n_samples)[0]
+            n_batches += 1
+        return np.array([total / n_batches])
+
+    def emit_data(self, data_tot: np.ndarray):
+        """Emit the photodiode signal
 
-        # synchron version (blocking function)
-        data_tot = self.controller.grab_monochromator()
+        Parameters
+        ----------
+        data_tot: ndarray
+            1D array containing the photodiode value
+        """
         self.dte_signal.emit(DataToExport(name='photodiode',
                                           data=[DataFromPlugins(name='Photodiode', data=[data_tot],
                                                                 dim='Data0D', labels=['Photodiode'])]))
@@ -138,6 +168,7 @@ class DAQ_0DViewer_Photodiode(DAQ_Viewer_base):
     def stop(self):
         """Stop the current grab hardware wise if necessary"""
         ## TODO for your custom plugin
+        self._live = False
         self.controller.stop()  # when writing your own plugin replace this line
         self.emit_status(ThreadCommand('Update_Status', ['Some info you want to log']))
         ##############################
@@ -1,5 +1,6 @@
 import numpy as np
 
+from pymodaq_utils.utils import ThreadCommand
 from pymodaq_data.data import DataToExport, Q_
 from pymodaq_gui.parameter import Parameter
 
@@ -32,12 +33,20 @@ class DAQ_1DViewer_Generator(DAQ_Viewer_base):
     # TODO add your particular attributes here if any
 
     """
+    hardware_averaging = True  # Naverage waveforms are summed in a running accumulator within the plugin
+    noise_level = 0.1  # V, standard deviation of the noise added to the waveforms
+
     params = comon_parameters+[
-        {'title': 'Npts:', 'name': 'npts', 'type': 'int', 'value': 256},
-        {'title': 'Delta time (s):', 'name': 'delta_t', 'type': 'float', 'value': 1e-3, 'suffix': 's', 'siPrefix': True},
+        {'title': 'Npts:', 'name': 'npts', 'type': 'int', 'value': 256, 'min': 1},
+        {'title': 'Delta time (s):', 'name': 'delta_t', 'type': 'float', 'value': 1e-3, 'min': 1e-9, 'suffix': 's',
+         'siPrefix': True},
         {'title': 'Waveforms:', 'name': 'waveform', 'type': 'list', 'limits': WaveType.names()},
         {'title': 'Amplitude:', 'name': 'amplitude', 'type': 'float', 'value': 1, 'suffix': 'V', 'siPrefix': True},
         {'title': 'Frequency:', 'name': 'frequency', 'type': 'float', 'value': 10, 'suffix': 'Hz', 'siPrefix': True},
+        {'title': 'Offset:', 'name': 'offset', 'type': 'float', 'value': 0., 'suffix': 'V', 'siPrefix': True},
+        {'title': 'Phase:', 'name': 'phase', 'type': 'float', 'value': 0., 'suffix': 'rad'},
+        {'title': 'Continuous:', 'name': 'continuous', 'type': 'bool', 'value': False,
+         'tip': 'Successive grabs are consecutive chunks of a phase continuous waveform'},
 
     ]
 
@@ -46,8 +55,9 @@ class DAQ_1DViewer_Generator(DAQ_Viewer_base):
         #  autocompletion
         self.controller: Optional[Generator] = None
 
-        #TODO declare here attributes you want/need to init with a default value
-        pass
+        self._continuous = False
+        self._stream = None
+        self._rng = np.random.default_rng()
 
     def commit_settings(self, param: Parameter):
         """Apply the consequences of a value change in the detector settings
@@ -57,12 +67,25 @@ class DAQ_1DViewer_Generator(DAQ_Viewer_base):
         param: Parameter
             A given parameter (within detector_settings) whose value has been changed by the user
         """
-        if param.name() == "amplitude":
-           self.controller.amplitude = Q_(param.value(), param.opts['suffix'])
-        elif param.name() == 'frequency':
-            self.controller.frequency = Q_(param.value(), 'Hz')
-        elif param.name() == 'waveform':
-            self.controller.waveform = param.value()
+        try:
+            if param.name() == "amplitude":
+               self.controller.amplitude = Q_(param.value(), param.opts['suffix'])
+            elif param.name() == 'frequency':
+                self.controller.frequency = Q_(param.value(), 'Hz')
+            elif param.name() == 'offset':
+                self.controller.offset = Q_(param.value(), 'V')
+            elif param.name() == 'phase':
+                self.controller.phase = Q_(param.value(), 'rad')
+            elif param.name() == 'waveform':
+                self.controller.wave_type = param.value()
+            elif param.name() in ('npts', 'delta_t'):
+                self.controller.set_sampling(self.settings['npts'], self.settings['delta_t'])
+                self._stream = None  # restart the stream with the new chunk size and time resolution
+            elif param.name() == 'continuous':
+                self._continuous = param.value()
+                self._stream = None
+        except ValueError as e:
+            self.emit_status(ThreadCommand('Update_Status', [str(e), 'log']))
 
     def ini_detector(self, controller=None):
         """Detector communication initialization
@@ -88,6 +111,14 @@ class DAQ_1DViewer_Generator(DAQ_Viewer_base):
             self.controller = controller
             initialized = True
 
+        self.controller.wave_type = self.settings['waveform']
+        self.controller.amplitude = Q_(self.settings['amplitude'], 'V')
+        self.controller.frequency = Q_(self.settings['frequency'], 'Hz')
+        self.controller.offset = Q_(self.settings['offset'], 'V')
+        self.controller.phase = Q_(self.settings['phase'], 'rad')
+        self.controller.set_sampling(self.settings['npts'], self.settings['delta_t'])
+        self._continuous = self.settings['continuous']
+
         info = "Whatever info you want to log"
         return info, initialized
 
@@ -103,25 +134,39 @@ class DAQ_1DViewer_Generator(DAQ_Viewer_base):
         Parameters
         ----------
         Naverage: int
-            Number of hardware averaging (if hardware averaging is possible, self.hardware_averaging should be set to
-            True in class preamble, and you should code this implementation)
+            Number of noisy waveforms averaged before emission. In continuous mode, one chunk of the stream is
+            emitted per grab, only its noise being averaged, so that the phase continuity is kept
         kwargs: dict
             other optional arguments
         """
-
-        npts = self.settings['npts']
-        dt = self.settings['delta_t']
-
-        time_array, waveform = self.controller.get_waveform(npts, Q_(dt, 's'))
+        if self._continuous:
+            if self._stream is None:
+                self._stream = self.controller.stream()
+            _, time_array, waveform = next(self._stream)  # in s and V
+        else:
+            time_array, waveform = self.controller.get_waveform_raw()  # in s and V, with the current sampling
+        waveform += self._average_noise(len(waveform), Naverage)
 
         self.dte_signal.emit(DataToExport(
             name='mydte',
             data=[DataFromPlugins(name='mymock',
-                                  data=[waveform.magnitude + 0.1 *np.random.randn(*waveform.shape)],
+                                  data=[waveform],
                                   dim='Data1D', labels=['label00',],
-                                  units=waveform.units,
+                                  units='V',
                                   axes=[Axis('Time', units='s',
-                                             data=time_array.m_as('s'))])]))
+                                             data=time_array)])]))
+
+    def _average_noise(self, npts: int, Naverage: int) -> np.ndarray:
+        """Mean of Naverage noise records, summed one record at a time into a running accumulator"""
+        noise = self._rng.standard_normal(npts)
+        if Naverage > 1:
+            record = np.empty((npts,))
+            for _ in range(Naverage - 1):
+                noise += self._rng.standard_normal(out=record)
+            noise *= self.noise_level / Naverage
+        else:
+            noise *= self.noise_level
+        return noise
 
     def stop(self):
         """Stop the current grab hardware wise if necessary"""
@@ -1,4 +1,5 @@
 import numpy as np
+from qtpy import QtCore
 
 from pymodaq_utils.utils import ThreadCommand
 from pymodaq_data.data import DataToExport, Axis
@@ -32,10 +33,24 @@ class DAQ_1DViewer_Spectro(DAQ_Viewer_base):
     # TODO add your particular attributes here if any
 
     """
+    hardware_averaging = True  # Naverage spectra are averaged by the spectrometer
+
+    callback_signal = QtCore.Signal(object)  # emitted from the acquisition thread of the spectrometer
+    error_signal = QtCore.Signal(object)  # emitted from the acquisition thread if the acquisition failed
+
     params = comon_parameters+[
-        ## TODO for your custom plugin
-        # elements to be added here as dicts in order to control your custom stage
-        ############
+        {'title': 'Asynchronous:', 'name': 'asynchronous', 'type': 'bool', 'value': False,
+         'tip': 'The exposure is done in a background thread and the data emitted when ready'},
+        {'title': 'Exposure:', 'name': 'exposure', 'type': 'float', 'value': 0., 'min': 0., 'suffix': 's',
+         'siPrefix': True, 'tip': 'Simulated exposure time of the asynchronous acquisition'},
+        {'title': 'Sensor width:', 'name': 'width', 'type': 'int', 'value': 256, 'min': 1, 'max': 1000000,
+         'tip': 'Number of pixels of the sensor along the dispersion axis'},
+        {'title': 'ROI:', 'name': 'roi', 'type': 'group', 'children': [
+            {'title': 'Start:', 'name': 'start', 'type': 'int', 'value': 0, 'min': 0},
+            {'title': 'Stop:', 'name': 'stop', 'type': 'int', 'value': 256, 'min': 1, 'max': 256},
+        ]},
+        {'title': 'Binning:', 'name': 'binning', 'type': 'int', 'value': 1, 'min': 1,
+         'tip': 'Number of adjacent pixels summed on the sensor before readout'},
         ]
 
     def ini_attributes(self):
@@ -46,6 +61,9 @@ class DAQ_1DViewer_Spectro(DAQ_Viewer_base):
         # TODO declare here attributes you want/need to init with a default value
 
         self.x_axis = None
+        self._data_x_axis = None
+
+        self._pending_naverage = None  # number of averaged spectra of the running asynchronous acquisition
 
     def commit_settings(self, param: Parameter):
         """Apply the consequences of a change of value in the detector settings
@@ -55,11 +73,27 @@ class DAQ_1DViewer_Spectro(DAQ_Viewer_base):
         param: Parameter
             A given parameter (within detector_settings) whose value has been changed by the user
         """
-        ## TODO for your custom plugin
-        if param.name() == "a_parameter_you've_added_in_self.params":
-           self.controller.your_method_to_apply_this_param_change()
-#        elif ...
-        ##
+        readout_changed = False
+        try:
+            if param.name() == 'exposure':
+                self.controller.exposure = param.value()
+            elif param.name() == 'width':
+                self.controller.Nx = param.value()
+                readout_changed = True
+                self.settings.child('roi', 'start').setValue(0)
+                self.settings.child('roi', 'stop').setLimits((1, param.value()))
+                self.settings.child('roi', 'stop').setValue(param.value())
+            elif param.name() in ('start', 'stop'):
+                self.controller.roi = (self.settings['roi', 'start'], self.settings['roi', 'stop'])
+                readout_changed = True
+            elif param.name() == 'binning':
+                self.controller.binning = param.value()
+                readout_changed = True
+        except ValueError as e:
+            self.emit_status(ThreadCommand('Update_Status', [str(e), 'log']))
+        if readout_changed and self._pending_naverage is not None:
+            # the readout change aborted the running acquisition, start it again with the new readout
+            self._start_acquisition(self._pending_naverage)
 
     def ini_detector(self, controller=None):
         """Detector communication initialization
@@ -86,22 +120,32 @@ class DAQ_1DViewer_Spectro(DAQ_Viewer_base):
             self.controller = controller
             initialized = True
 
-        ## TODO for your custom plugin
-        # get the x_axis (you may want to to this also in the commit settings if x_axis may have changed
-        data_x_axis = self.controller.get_wavelength_axis()  # if possible
-        self.x_axis = Axis(data=data_x_axis, label='wl_axis', units='m', index=0)
+        self.controller.Nx = self.settings['width']
+        self.controller.roi = (self.settings['roi', 'start'], self.settings['roi', 'stop'])
+        self.controller.binning = self.settings['binning']
+
+        self.callback_signal.connect(self.callback)
+        self.error_signal.connect(self.on_error)
 
         # TODO for your custom plugin. Initialize viewers pannel with the future type of data
         self.dte_signal_temp.emit(DataToExport(name='spectro_temp',
                                                data=[DataFromPlugins(name='Spectro_temp',
-                                                                     data=[np.array([0 for _ in range(256)])],
+                                                                     data=[np.zeros((self.controller.n_pixels,))],
                                                                      dim='Data1D', labels=['data_temp'],
-                                                                     axes=[self.x_axis])]))
+                                                                     axes=[self.get_x_axis()])]))
 
         info = "Whatever info you want to log"
 
         return info, initialized
 
+    def get_x_axis(self) -> Axis:
+        """Get the wavelength axis, only rebuilt when the grating or the central wavelength changed"""
+        data_x_axis = self.controller.get_wavelength_axis()
+        if data_x_axis is not self._data_x_axis:
+            self._data_x_axis = data_x_axis
+            self.x_axis = Axis(data=data_x_axis * 1e-9, label='wl_axis', units='m', index=0)
+        return self.x_axis
+
     def close(self):
         """Terminate the communication protocol"""
         if self.is_master:  # To specify for avoiding slave closing connection issue
@@ -113,26 +157,46 @@ class DAQ_1DViewer_Spectro(DAQ_Viewer_base):
         Parameters
         ----------
         Naverage: int
-            Number of hardware averaging (if hardware averaging is possible, self.hardware_averaging should be set to
-            True in class preamble and you should code this implementation)
+            Number of spectra averaged by the spectrometer
         kwargs: dict
             others optionals arguments
         """
-        ## TODO for your custom plugin: you should choose EITHER the synchron or the asynchron version following
+        if self.settings['asynchronous']:
+            # asynchrone version: the spectrometer thread emits callback_signal when the spectrum is ready
+            self._start_acquisition(Naverage)
+        else:
+            # synchrone version (blocking function)
+            self.callback(self.controller.grab_average(Naverage))
+
+    def _start_acquisition(self, Naverage: int):
+        self._pending_naverage = Naverage
+        self.controller.start_acquisition(self.callback_signal.emit, Naverage,
+                                          error_callback=self.error_signal.emit)
+
+    def on_error(self, error: Exception):
+        """Log the failure of the asynchronous acquisition"""
+        self._pending_naverage = None
+        self.emit_status(ThreadCommand('Update_Status', [f'Acquisition failed: {str(error)}', 'log']))
+
+    def callback(self, data_tot: np.ndarray):
+        """Emit the acquired spectrum, called directly or once the asynchronous acquisition is done
 
-        ##synchrone version (blocking function)
-        data_tot = self.controller.grab_spectrum()
+        Parameters
+        ----------
+        data_tot: ndarray
+            The spectrum
+        """
+        self._pending_naverage = None
         self.dte_signal.emit(DataToExport('spectro',
-                                          data=[DataFromPlugins(name='Spectro', data=data_tot,
+                                          data=[DataFromPlugins(name='Spectro', data=[data_tot],
                                                                 dim='Data1D', labels=['data'],
-                                                                axes=[self.x_axis])]))
-
-        data_x_axis = self.controller.get_wavelength_axis()*1e-9  # if possible
-        self.x_axis = Axis(data=data_x_axis, label='wl_axis', units='m', index=0)
+                                                                axes=[self.get_x_axis()])]))
 
     def stop(self):
         """Stop the current grab hardware wise if necessary"""
         ## TODO for your custom plugin
+        self._pending_naverage = None
+        self.controller.abort_acquisition()
         self.controller.stop()  # when writing your own plugin replace this line
         self.emit_status(ThreadCommand('Update_Status', ['Clicked stop']))
         #########################
@@ -1,8 +1,7 @@
 import numpy as np
-from pymodaq_utils.math_utils import my_moment
 
 from pymodaq_utils.utils import ThreadCommand
-from pymodaq_data.data import DataToExport, Axis
+from pymodaq_data.data import DataToExport
 from pymodaq_gui.parameter import Parameter
 
 from pymodaq.control_modules.viewer_utility_classes import DAQ_Viewer_base, comon_parameters, main
@@ -20,49 +19,57 @@ from pymodaq_plugins_teaching.hardware.spectrometer import Spectrometer
 #     pymodaq_plugins_my_plugin/daq_viewer_plugins/plugins_1D
 
 
-class DAQ_1DViewer_Spectro_Moments(DAQ_1DViewer_Spectro):
+def spectral_moments(axis: np.ndarray, spectra: np.ndarray) -> np.ndarray:
+    """Mean, standard deviation, skewness and kurtosis of spectra over an evenly spaced axis
 
-    def grab_data(self, Naverage=1, **kwargs):
-        """Start a grab from the detector
+    The weighted sums of orders 0 to 4 are obtained from a single matrix product with the powers of the axis, centred
+    on its middle to limit rounding errors, and the moments derived from them
 
-        Parameters
-        ----------
-        Naverage: int
-            Number of hardware averaging (if hardware averaging is possible, self.hardware_averaging should be set to
-            True in class preamble and you should code this implementation)
-        kwargs: dict
-            others optionals arguments
+    Parameters
+    ----------
+    axis: ndarray
+        1D array of length n_pixels
+    spectra: ndarray
+        A spectrum of shape (n_pixels,) or a stack of spectra of shape (n_frames, n_pixels)
 
+    Returns
+    -------
+    ndarray: the mean, std, skewness and (non excess) kurtosis, of shape (4,) or (n_frames, 4)
+    """
+    center = axis[len(axis) // 2]
+    sums = spectra @ np.vander(axis - center, 5, increasing=True)
+    m1, m2, m3, m4 = np.moveaxis(sums[..., 1:] / sums[..., :1], -1, 0)  # raw moments around the center
+    variance = m2 - m1 ** 2
+    skewness = (m3 - 3 * m1 * m2 + 2 * m1 ** 3) / variance ** 1.5
+    kurtosis = (m4 - 4 * m1 * m3 + 6 * m1 ** 2 * m2 - 3 * m1 ** 4) / variance ** 2
+    return np.stack((m1 + center, np.sqrt(variance), skewness, kurtosis), axis=-1)
 
-        """
 
-        spectrum = self.controller.grab_spectrum()
-        wl = self.controller.get_wavelength_axis()
+class DAQ_1DViewer_Spectro_Moments(DAQ_1DViewer_Spectro):
 
-        moments = my_moment(wl, spectrum)
-        moments_bis = my_moment(spectrum, wl)
+    moment_names = ('mean', 'std', 'skewness', 'kurtosis')
 
-        ## TODO for your custom plugin: you should choose EITHER the synchron or the asynchron version following
+    def callback(self, data_tot: np.ndarray):
+        """Emit the acquired spectrum and its moments, called directly or once the asynchronous acquisition is done
+
+        Parameters
+        ----------
+        data_tot: ndarray
+            The spectrum
+        """
+        self._pending_naverage = None
+        moments = spectral_moments(self.controller.get_wavelength_axis(), data_tot)
 
-        ##synchrone version (blocking function)
-        data_tot = self.controller.grab_spectrum()
         self.dte_signal.emit(DataToExport('mydte',
                                           data=[DataFromPlugins(name='data_spectro',
                                                                 data=[data_tot],
                                                                 dim='Data1D',
                                                                 labels=['data_spectro'],
-                                                                axes=[self.x_axis]),
-                                                DataFromPlugins(name='mean',
-                                                                data=[np.atleast_1d(moments[0])],
-                                                                dim='Data0D'),
-                                                DataFromPlugins(name='std',
-                                                                data=[np.atleast_1d(moments_bis[1])],
+                                                                axes=[self.get_x_axis()])] +
+                                               [DataFromPlugins(name=name,
+                                                                data=[np.atleast_1d(moment)],
                                                                 dim='Data0D')
-                                                ]))
-
-
-        data_x_axis = self.controller.get_wavelength_axis()*1e-9  # if possible
-        self.x_axis = Axis(data=data_x_axis, label='wl_axis', units='m', index=0)
+                                                for name, moment in zip(self.moment_names, moments)]))
 
 
 if __name__ == '__main__':
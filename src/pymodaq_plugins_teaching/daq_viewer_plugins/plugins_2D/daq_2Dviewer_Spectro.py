@@ -0,0 +1,165 @@
+import numpy as np
+
+from pymodaq_utils.utils import ThreadCommand
+from pymodaq_data.data import DataToExport, Axis
+from pymodaq_gui.parameter import Parameter
+
+from pymodaq.control_modules.viewer_utility_classes import DAQ_Viewer_base, comon_parameters, main
+from pymodaq.utils.data import DataFromPlugins
+
+from pymodaq_plugins_teaching.hardware.spectrometer import Spectrometer
+
+
+class DAQ_2DViewer_Spectro(DAQ_Viewer_base):
+    """ Instrument plugin class for a 2D viewer.
+
+    This object inherits all functionalities to communicate with PyMoDAQ’s DAQ_Viewer module through inheritance via
+    DAQ_Viewer_base. It makes a bridge between the DAQ_Viewer module and the Python wrapper of a particular instrument.
+
+    Images are read from the camera of the mock Spectrometer: wavelength along the columns, and the illumination
+    profile of the slit along the rows. The sensor size, the horizontal and vertical ROIs and binnings can be set to
+    emulate realistic camera frame sizes.
+
+    Attributes:
+    -----------
+    controller: object
+        The particular object that allow the communication with the hardware, in general a python wrapper around the
+         hardware library.
+
+    """
+    params = comon_parameters+[
+        {'title': 'Sensor width:', 'name': 'width', 'type': 'int', 'value': 256, 'min': 1, 'max': 2048},
+        {'title': 'Sensor height:', 'name': 'height', 'type': 'int', 'value': 128, 'min': 1, 'max': 2048},
+        {'title': 'ROI:', 'name': 'roi', 'type': 'group', 'children': [
+            {'title': 'Start:', 'name': 'start', 'type': 'int', 'value': 0, 'min': 0},
+            {'title': 'Stop:', 'name': 'stop', 'type': 'int', 'value': 256, 'min': 1, 'max': 256},
+        ]},
+        {'title': 'Binning:', 'name': 'binning', 'type': 'int', 'value': 1, 'min': 1,
+         'tip': 'Number of adjacent columns summed on the sensor before readout'},
+        {'title': 'Vertical ROI:', 'name': 'vertical_roi', 'type': 'group', 'children': [
+            {'title': 'Start:', 'name': 'start', 'type': 'int', 'value': 0, 'min': 0},
+            {'title': 'Stop:', 'name': 'stop', 'type': 'int', 'value': 128, 'min': 1, 'max': 128},
+        ]},
+        {'title': 'Vertical binning:', 'name': 'vertical_binning', 'type': 'int', 'value': 1, 'min': 1},
+        ]
+
+    def ini_attributes(self):
+        self.controller: Spectrometer = None
+
+        self.x_axis = None
+        self.y_axis = None
+        self._data_x_axis = None
+
+    def commit_settings(self, param: Parameter):
+        """Apply the consequences of a change of value in the detector settings
+
+        Parameters
+        ----------
+        param: Parameter
+            A given parameter (within detector_settings) whose value has been changed by the user
+        """
+        try:
+            if param.name() == 'width':
+                self.controller.Nx = param.value()
+                self.settings.child('roi', 'start').setValue(0)
+                self.settings.child('roi', 'stop').setLimits((1, param.value()))
+                self.settings.child('roi', 'stop').setValue(param.value())
+            elif param.name() == 'height':
+                self.controller.Ny = param.value()
+                self.settings.child('vertical_roi', 'start').setValue(0)
+                self.settings.child('vertical_roi', 'stop').setLimits((1, param.value()))
+                self.settings.child('vertical_roi', 'stop').setValue(param.value())
+            elif param.name() in ('start', 'stop') and param.parent().name() == 'roi':
+                self.controller.roi = (self.settings['roi', 'start'], self.settings['roi', 'stop'])
+            elif param.name() == 'binning':
+                self.controller.binning = param.value()
+            elif param.name() in ('start', 'stop'):
+                self.controller.vertical_roi = (self.settings['vertical_roi', 'start'],
+                                                self.settings['vertical_roi', 'stop'])
+            elif param.name() == 'vertical_binning':
+                self.controller.vertical_binning = param.value()
+        except ValueError as e:
+            self.emit_status(ThreadCommand('Update_Status', [str(e), 'log']))
+        self.y_axis = None
+
+    def ini_detector(self, controller=None):
+        """Detector communication initialization
+
+        Parameters
+        ----------
+        controller: (object)
+            custom object of a PyMoDAQ plugin (Slave case). None if only one actuator/detector by controller
+            (Master case)
+
+        Returns
+        -------
+        info: str
+        initialized: bool
+            False if initialization failed otherwise True
+        """
+
+        self.ini_detector_init(slave_controller=controller)
+
+        if self.is_master:
+            self.controller = Spectrometer()
+            initialized = self.controller.open_communication()
+        else:
+            self.controller = controller
+            initialized = True
+
+        self.controller.Nx = self.settings['width']
+        self.controller.Ny = self.settings['height']
+        self.controller.roi = (self.settings['roi', 'start'], self.settings['roi', 'stop'])
+        self.controller.binning = self.settings['binning']
+        self.controller.vertical_roi = (self.settings['vertical_roi', 'start'], self.settings['vertical_roi', 'stop'])
+        self.controller.vertical_binning = self.settings['vertical_binning']
+
+        self.dte_signal_temp.emit(DataToExport(name='spectro2D_temp',
+                                               data=[DataFromPlugins(name='Spectro2D_temp',
+                                                                     data=[np.zeros(self.controller.get_image_shape())],
+                                                                     dim='Data2D', labels=['image_temp'],
+                                                                     axes=self.get_axes())]))
+
+        info = "Whatever info you want to log"
+        return info, initialized
+
+    def get_axes(self) -> list:
+        """Get the rows and wavelength axes, only rebuilt when they changed"""
+        if self.y_axis is None:
+            self.y_axis = Axis(data=self.controller.get_vertical_axis(), label='rows', units='', index=0)
+        data_x_axis = self.controller.get_wavelength_axis()
+        if data_x_axis is not self._data_x_axis:
+            self._data_x_axis = data_x_axis
+            self.x_axis = Axis(data=data_x_axis * 1e-9, label='wl_axis', units='m', index=1)
+        return [self.y_axis, self.x_axis]
+
+    def close(self):
+        """Terminate the communication protocol"""
+        if self.is_master:
+            self.controller.close_communication()
+
+    def grab_data(self, Naverage=1, **kwargs):
+        """Start a grab from the detector
+
+        Parameters
+        ----------
+        Naverage: int
+            Number of hardware averaging (not available, averaging is done by PyMoDAQ)
+        kwargs: dict
+            others optionals arguments
+        """
+        data_tot = self.controller.grab_image()
+        self.dte_signal.emit(DataToExport('spectro2D',
+                                          data=[DataFromPlugins(name='Spectro2D', data=[data_tot],
+                                                                dim='Data2D', labels=['image'],
+                                                                axes=self.get_axes())]))
+
+    def stop(self):
+        """Stop the current grab hardware wise if necessary"""
+        self.controller.stop()
+        self.emit_status(ThreadCommand('Update_Status', ['Clicked stop']))
+        return ''
+
+
+if __name__ == '__main__':
+    main(__file__)
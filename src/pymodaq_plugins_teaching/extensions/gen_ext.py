@@ -12,6 +12,9 @@ from pymodaq.control_modules.daq_viewer import DAQ_Viewer, DAQTypesEnum
 
 from pymodaq.extensions.utils import CustomExt
 from pymodaq_plugins_teaching.utils import Config as PluginConfig
+from pymodaq_plugins_teaching.processing.spectral import FFTMagnitude, WelchPSD, WINDOWS
+from pymodaq_plugins_teaching.processing.worker import AnalysisWorker
+from pymodaq_plugins_teaching.processing.display import DisplayThrottle
 
 plugin_config = PluginConfig()
 
@@ -21,8 +24,20 @@ CLASS_NAME = 'GenExt'  # this should be the name of your class defined below
 
 class GenExt(CustomExt):
 
+    display_rate = 30.  # Hz, maximum refresh rate of the viewers, faster frames are coalesced
+
     params = [
         {'title': 'Frequency', 'name': 'frequency', 'type': 'slide', 'value': 10, 'default': 10, 'limits': (1, 1000), 'subtype': 'linear'},
+        {'title': 'Spectrum', 'name': 'spectrum', 'type': 'list', 'limits': ['FFT', 'PSD'], 'value': 'FFT',
+         'tip': 'Magnitude of the FFT or Welch averaged power spectral density'},
+        {'title': 'PSD', 'name': 'psd', 'type': 'group', 'children': [
+            {'title': 'Window', 'name': 'window', 'type': 'list', 'limits': list(WINDOWS), 'value': 'hann'},
+            {'title': 'Segment length', 'name': 'segment_length', 'type': 'int', 'value': 256, 'min': 2},
+            {'title': 'Overlap (%)', 'name': 'overlap', 'type': 'int', 'value': 50, 'min': 0, 'max': 90,
+             'tip': '0 for the Bartlett method'},
+            {'title': 'Averaging', 'name': 'n_averaging', 'type': 'int', 'value': 10, 'min': 1,
+             'tip': 'Number of grabs in the exponential averaging'},
+        ]},
     ]
 
 
@@ -31,10 +46,19 @@ class GenExt(CustomExt):
 
         self.viewer1D_raw: Optional[Viewer1D] = None
         self.viewer1D_fft: Optional[Viewer1D] = None
+        self.display_raw: Optional[DisplayThrottle] = None
+        self.display_fft: Optional[DisplayThrottle] = None
 
         self.daq_viewer: DAQ_Viewer = self.modules_manager.get_mod_from_name("Generator")
 
         self.dwa_raw: Optional[DataWithAxes] = None
+        self.dwa_fft: Optional[DataWithAxes] = None
+        self.fft = FFTMagnitude()
+        self.psd = WelchPSD(window=self.settings['psd', 'window'],
+                            segment_length=self.settings['psd', 'segment_length'],
+                            overlap=self.settings['psd', 'overlap'] / 100,
+                            n_averaging=self.settings['psd', 'n_averaging'])
+        self.worker = AnalysisWorker(self.analyse)
 
         self.setup_ui()
 
@@ -56,6 +80,8 @@ class GenExt(CustomExt):
         self.docks['raw_viewer'].addWidget(self.viewer1D_raw.parent)  # parent for accessing QWidget (for adding in dock)
 
         self.viewer1D_fft = Viewer1D(QtWidgets.QWidget())
+        self.display_raw = DisplayThrottle(self.viewer1D_raw, self.display_rate)
+        self.display_fft = DisplayThrottle(self.viewer1D_fft, self.display_rate)
         self.docks['fft_viewer'].addWidget(self.viewer1D_fft.parent)
 
 
@@ -79,6 +105,7 @@ class GenExt(CustomExt):
     def connect_things(self):
         # self.daq_viewer.grab_done_signal.connect(lambda dte: self.viewer1D_raw.show_data(dte[0]))
         self.daq_viewer.grab_done_signal.connect(self.get_dwa_and_show)
+        self.worker.result_ready.connect(self.show_analysis)
 
         self.connect_action('snap', self.daq_viewer.snap)
         self.connect_action('grab', self.daq_viewer.grab)
@@ -89,14 +116,39 @@ class GenExt(CustomExt):
 
     def get_dwa_and_show(self, dte=DataToExport):
         self.dwa_raw = dte[0]
-        self.viewer1D_raw.show_data(self.dwa_raw)
-
-        self.dwa_fft = self.dwa_raw.ft()
-        self.viewer1D_fft.show_data(abs(self.dwa_fft))
+        self.display_raw.show_data(self.dwa_raw)
+        self.worker.submit(self.dwa_raw)
+
+    def analyse(self, dwa: DataWithAxes) -> DataWithAxes:
+        """Spectral analysis of the raw data, called from the worker thread"""
+        if self.settings['spectrum'] == 'PSD':
+            return self.psd.process(dwa)
+        return self.fft.process(dwa)
+
+    def show_analysis(self):
+        dwa = self.worker.take_result()
+        if dwa is not None:
+            self.dwa_fft = dwa
+            self.display_fft.show_data(self.dwa_fft)
     
     def value_changed(self, param: Parameter):
         if param.name() == "frequency":
             self.daq_viewer.settings.child('detector_settings', 'frequency').setValue(param.value())
+            with self.worker.lock:
+                self.psd.reset()
+        elif param.name() == 'spectrum':
+            with self.worker.lock:
+                self.psd.reset()
+        elif param.name() == 'overlap':
+            with self.worker.lock:
+                self.psd.overlap = param.value() / 100
+        elif param.name() in ('window', 'segment_length', 'n_averaging'):
+            with self.worker.lock:
+                setattr(self.psd, param.name(), param.value())
+
+    def _quit_fun(self) -> bool:
+        self.worker.stop()
+        return True
 
 def main():
     from pymodaq_gui.utils.utils import mkQApp
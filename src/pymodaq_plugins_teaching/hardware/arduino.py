@@ -1,34 +1,103 @@
 import numbers
+from time import perf_counter
+from typing import List, Optional
+
 from pyvisa import ResourceManager
 
 from pymodaq.utils.data import DataRaw, Axis
 from pymodaq.utils.math_utils import np, gauss1D
 
 
-VISA_rm = ResourceManager()
-
-COM_PORTS = []
-for name, rinfo in VISA_rm.list_resources_info().items():
-    if rinfo.alias is not None:
-        COM_PORTS.append(rinfo.alias)
-    else:
-        COM_PORTS.append(name)
+COM_PORTS_TTL = 30.  # s, time during which the enumerated VISA resources are considered valid
 
-SIZE = 256
+SIZE = 256  # default number of points of the generated spectra
 LAMBDA_RED = 650
 LAMBDA_GREEN = 515
 LAMBDA_BLUE = 450
 
+_VISA_rm: Optional[ResourceManager] = None
+_com_ports: List[str] = []
+_com_ports_time: Optional[float] = None
+
+
+def get_resource_manager() -> ResourceManager:
+    """Get the VISA resource manager, created on first use"""
+    global _VISA_rm
+    if _VISA_rm is None:
+        _VISA_rm = ResourceManager()
+    return _VISA_rm
+
+
+def get_com_ports(refresh: bool = False) -> List[str]:
+    """Get the addresses (or their alias) of the available VISA resources
+
+    The VISA bus is only scanned on first call, then when the cached list is older than COM_PORTS_TTL or if a refresh
+    is requested
+
+    Parameters
+    ----------
+    refresh: bool
+        If True, scan the VISA bus whatever the age of the cached list
+
+    Returns
+    -------
+    list of str
+    """
+    global _com_ports, _com_ports_time
+    if refresh or _com_ports_time is None or perf_counter() - _com_ports_time > COM_PORTS_TTL:
+        com_ports = []
+        for name, rinfo in get_resource_manager().list_resources_info().items():
+            if rinfo.alias is not None:
+                com_ports.append(rinfo.alias)
+            else:
+                com_ports.append(name)
+        _com_ports = com_ports
+        _com_ports_time = perf_counter()
+    return _com_ports
+
+
+def __getattr__(name):
+    """Module level VISA_rm and COM_PORTS are only built when accessed"""
+    if name == 'VISA_rm':
+        return get_resource_manager()
+    elif name == 'COM_PORTS':
+        return get_com_ports()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+class _ComPorts:
+    """Descriptor enumerating the VISA resources only when Arduino.COM_PORTS is accessed"""
+
+    def __get__(self, instance, owner) -> List[str]:
+        return get_com_ports()
+
 
 class Arduino:
-    COM_PORTS = COM_PORTS
+    COM_PORTS = _ComPorts()
 
     led_pins = {'red': 9, 'green': 10, 'blue': 11}
     servo_pin = 3
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, size: int = SIZE, **kwargs):
         super().__init__(*args, **kwargs)
         self.pin_values_output = {9: 0, 10: 0, 11: 0, 3: 80}
+        self.size = size
+
+    @property
+    def size(self) -> int:
+        """Get/Set the number of points of the generated spectra"""
+        return self._size
+
+    @size.setter
+    def size(self, value: int):
+        if value < 1:
+            raise ValueError(f'A spectrum of {value} points is not possible. It should be strictly positive')
+        self._size = int(value)
+
+    @staticmethod
+    def refresh_com_ports() -> List[str]:
+        """Scan again the VISA bus for available resources"""
+        return get_com_ports(refresh=True)
 
     @staticmethod
     def round_value(value):
@@ -56,9 +125,9 @@ class Arduino:
 
     def generate_spectrum(self) -> DataRaw:
         """ Grab a spectrum revealing the content of the RGB LED"""
-        axis = Axis('wavelength', units='m', data=np.linspace(400, 800, SIZE, endpoint=True) * 1e-9)
+        axis = Axis('wavelength', units='m', data=np.linspace(400, 800, self.size, endpoint=True) * 1e-9)
 
-        data_array = np.zeros((SIZE,))
+        data_array = np.zeros((self.size,))
         if self.pin_values_output[self.servo_pin] > 70:
             data_array += (gauss1D(axis.get_data(), LAMBDA_RED, 15) *
                            self.pin_values_output[self.led_pins['red']])
@@ -1,30 +1,101 @@
 from enum import StrEnum
+from typing import Iterator, Tuple
+
 import numpy as np
 
 from pymodaq_utils.math_utils import linspace_step_N
 from pymodaq_data import Q_
 
 
+PHASE_BITS = 32  # resolution of the phase accumulator indexing the arbitrary waveform table
+
+
 class WaveType(StrEnum):
     SINUS = 'Sinus'
     SQUARE = 'Square'
     TRIANGLE = 'Triangle'
+    ARBITRARY = 'Arbitrary'
 
     @classmethod
     def names(cls):
         return list(cls._value2member_map_.keys())
 
 
+def square(phase: np.ndarray) -> np.ndarray:
+    """Unit square wave in phase with np.sin"""
+    return np.where(np.mod(phase, 2 * np.pi) < np.pi, 1., -1.)
+
+
+def triangle(phase: np.ndarray) -> np.ndarray:
+    """Unit triangle wave in phase with np.sin"""
+    return 4 * np.abs(np.mod(phase / (2 * np.pi) - 0.25, 1.) - 0.5) - 1
+
+
+WAVEFORMS = {WaveType.SINUS: np.sin,
+             WaveType.SQUARE: square,
+             WaveType.TRIANGLE: triangle}
+
+
 
 class Generator():
+    """Mock function generator
+
+    The parameters are stored as plain floats in SI units (Hz, V, rad) converted once in the setters, so that the
+    waveform synthesis is done on raw float64 arrays. The synthesis state derived from them and from the sampling
+    (time base, sample ramp and phase step per sample) is only computed again when one of them changes.
+    """
 
     def __init__(self):
         self._wave_type = WaveType.SINUS
-        self._freq = Q_(10., 'Hz')
-        self._amp = Q_(1., 'V')
-        self._offset = Q_(0., 'V')
-        self._phase = Q_(0., 'rad')
+        self._freq = 10.  # Hz
+        self._amp = 1.  # V
+        self._offset = 0.  # V
+        self._phase = 0.  # rad
+        self._table = np.sin(np.linspace(0, 2 * np.pi, 1024, endpoint=False))
+
+        self._npts = 0
+        self._dt = 0.  # s
+        self._time_base: np.ndarray = None  # s, read-only
+        self._ramp: np.ndarray = None  # sample indexes as floats
+        self._omega_dt = 0.  # rad, phase step per sample
+        self.set_sampling(256, 1e-3)
 
+    def set_sampling(self, Npts: int, dt: float):
+        """Set the number of points and time resolution of the synthesized waveforms
+
+        Parameters
+        ----------
+        Npts: The number of points in the waveform
+        dt: the time resolution in seconds
+        """
+        if Npts < 1 or dt <= 0:
+            raise ValueError(f'A sampling of {Npts} points every {dt} s is not possible')
+        if (Npts, dt) == (self._npts, self._dt):
+            return
+        self._npts = int(Npts)
+        self._dt = float(dt)
+        self._time_base = linspace_step_N(0., self._dt, self._npts)
+        self._time_base.flags.writeable = False
+        self._ramp = np.arange(self._npts, dtype=float)
+        self._update_phase_step()
+
+    def _update_phase_step(self):
+        self._omega_dt = 2 * np.pi * self._freq * self._dt
+
+    @property
+    def npts(self) -> int:
+        """Get the number of points of the synthesized waveforms"""
+        return self._npts
+
+    @property
+    def dt(self) -> float:
+        """Get the time resolution in seconds of the synthesized waveforms"""
+        return self._dt
+
+    @property
+    def time_base(self) -> np.ndarray:
+        """Get the read-only time array in seconds of the synthesized waveforms"""
+        return self._time_base
 
     @property
     def wave_type(self):
@@ -37,39 +108,82 @@ class Generator():
 
     @property
     def frequency(self):
-        return self._freq
+        return Q_(self._freq, 'Hz')
 
     @frequency.setter
     def frequency(self, freq: Q_):
         if freq.is_compatible_with('Hz'):
-            self._freq = freq.to('Hz')
+            self._freq = freq.m_as('Hz')
+            self._update_phase_step()
 
     @property
     def amplitude(self):
-        return self._amp
+        return Q_(self._amp, 'V')
 
     @amplitude.setter
     def amplitude(self, amp: Q_):
         if amp.is_compatible_with('V'):
-            self._amp = amp.to('V')
+            self._amp = amp.m_as('V')
 
     @property
     def offset(self):
-        return self._offset
+        return Q_(self._offset, 'V')
 
     @offset.setter
     def offset(self, offset: Q_):
         if offset.is_compatible_with('V'):
-            self._offset = offset.to('V')
+            self._offset = offset.m_as('V')
 
     @property
     def phase(self):
-        return self._phase
+        return Q_(self._phase, 'rad')
 
     @phase.setter
     def phase(self, phase: Q_):
         if phase.is_compatible_with('rad'):
-            self._phase = phase.to('rad')
+            self._phase = phase.m_as('rad')
+
+    @property
+    def arbitrary_table(self) -> np.ndarray:
+        """Get/Set the lookup table of one period of the arbitrary waveform, in units of the amplitude"""
+        return self._table
+
+    @arbitrary_table.setter
+    def arbitrary_table(self, table: np.ndarray):
+        table = np.array(table, dtype=float)
+        if table.ndim != 1 or len(table) < 2:
+            raise ValueError('The arbitrary waveform table should be a 1D array of at least 2 points')
+        self._table = table
+
+    def _arbitrary(self, Npts: int, cycles_per_sample: float, start_cycles: float) -> np.ndarray:
+        """Read the arbitrary waveform table as a direct digital synthesizer
+
+        A PHASE_BITS wide phase accumulator is incremented by a constant tuning word at each sample and its value
+        scaled to the table length gives the table index.
+
+        Parameters
+        ----------
+        Npts: int
+            The number of samples
+        cycles_per_sample: float
+            The number of waveform periods per sample (frequency times time resolution)
+        start_cycles: float
+            The phase of the first sample in number of periods
+
+        Returns
+        -------
+        np.ndarray: 1D array of Npts values of the table
+        """
+        full_scale = 1 << PHASE_BITS
+        tuning_word = np.uint64(round(cycles_per_sample * full_scale) % full_scale)
+        start = np.uint64(round(start_cycles * full_scale) % full_scale)
+        accumulator = np.arange(Npts, dtype=np.uint64)
+        accumulator *= tuning_word
+        accumulator += start
+        accumulator &= np.uint64(full_scale - 1)
+        accumulator *= np.uint64(len(self._table))
+        accumulator >>= np.uint64(PHASE_BITS)
+        return self._table[accumulator]
 
     def get_waveform(self, Npts: int, dt: Q_):
         """ Generate a waveform given the number of points and time resolution
@@ -84,7 +198,69 @@ class Generator():
         np.ndarray: 1D array containing the time
         np.ndarray: 1D Quantity array containing the waveform
         """
-        time_array = linspace_step_N(Q_(0., 's'), dt, Npts)
+        time_array, waveform = self.get_waveform_raw(Npts, dt.m_as('s'))
+        return Q_(np.array(time_array), 's'), Q_(waveform, 'V')
+
+    def get_waveform_raw(self, Npts: int = None, dt: float = None):
+        """ Generate a waveform given the number of points and time resolution, without units
 
-        if self._wave_type == WaveType.SINUS:
-            return time_array, self.amplitude * np.sin(2 * np.pi * self.frequency * time_array - self.phase) + self.offset
\ No newline at end of file
+        Parameters
+        ----------
+        Npts: The number of points in the waveform, default to the current sampling
+        dt: the time resolution in seconds, default to the current sampling
+
+        Returns
+        -------
+        np.ndarray: 1D read-only float array containing the time in seconds (the time_base)
+        np.ndarray: 1D float array containing the waveform in volts
+        """
+        self.set_sampling(self._npts if Npts is None else Npts, self._dt if dt is None else dt)
+        return self._time_base, self._synthesize()
+
+    def _synthesize(self, cycles: float = 0.) -> np.ndarray:
+        """ Compute the waveform in volts with the current sampling
+
+        Parameters
+        ----------
+        cycles: the phase accumulated before the first sample, in number of periods
+        """
+        if self._wave_type == WaveType.ARBITRARY:
+            waveform = self._arbitrary(self._npts, self._freq * self._dt, cycles - self._phase / (2 * np.pi))
+        else:
+            phase = self._ramp * self._omega_dt
+            phase += 2 * np.pi * cycles - self._phase
+            waveform = WAVEFORMS[self._wave_type](phase)
+        waveform *= self._amp
+        waveform += self._offset
+        return waveform
+
+    def stream(self, Npts: int = None, dt: float = None) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """ Generate successive chunks of a continuous waveform
+
+        The phase is accumulated from chunk to chunk with the current frequency, so that the waveform stays
+        continuous even if the frequency is changed while streaming. Only one chunk is in memory at a time.
+
+        Parameters
+        ----------
+        Npts: The number of points in each chunk, default to the current sampling
+        dt: the time resolution in seconds, default to the current sampling
+
+        Yields
+        ------
+        int: the index of the first sample of the chunk since the start of the stream
+        np.ndarray: 1D float array containing the time in seconds
+        np.ndarray: 1D float array containing the waveform in volts
+        """
+        self.set_sampling(self._npts if Npts is None else Npts, self._dt if dt is None else dt)
+        Npts, dt = self._npts, self._dt
+        start = 0
+        cycles = 0.
+        while True:
+            self.set_sampling(Npts, dt)  # the sampling of the stream is kept whatever the other users of the generator
+            waveform = self._synthesize(cycles)
+            time_array = self._time_base + start * dt
+            # phase at the end of the chunk, from the frequency it has been synthesized with
+            next_cycles = (cycles + self._freq * dt * Npts) % 1.
+            yield start, time_array, waveform
+            start += Npts
+            cycles = next_cycles
@@ -8,6 +8,7 @@ import warnings
 
 from pymodaq_plugins_teaching.hardware.serial_addresses import SerialAddresses, BaseEnum
 import random
+import numpy as np
 from pylablib.core.devio import SCPI, interface
 from pylablib.devices.Keithley.multimeter import TGenericFunctionParameters
 
@@ -53,6 +54,8 @@ class Keithley2110:
         self._resolution: float = 1e-5
         self._auto: bool = True
         self._range: float = 0.1
+        self._trigger_count: int = 1
+        self._rng = np.random.default_rng()
 
         self._is_open = False
         if address is not None:
@@ -105,6 +108,49 @@ class Keithley2110:
             raise TimeoutError
         return int(self._range * random.random() / self._resolution) * self._resolution
 
+    def get_trigger_count(self) -> int:
+        """ Get the number of readings acquired in the buffer per trigger"""
+        if not self.is_open:
+            raise TimeoutError
+        return self._trigger_count
+
+    def set_trigger_count(self, count: int) -> int:
+        """ Set the number of readings acquired in the buffer per trigger
+
+        Parameters
+        ----------
+        count: int
+            strictly positive number of readings
+        Returns
+        -------
+        int: the current trigger count
+        """
+        if not self.is_open:
+            raise TimeoutError
+        if count < 1:
+            raise ValueError(f'A trigger count of {count} is not possible. It should be strictly positive')
+        self._trigger_count = int(count)
+        return self._trigger_count
+
+    def get_readings(self, n: int = None, channel='primary') -> np.ndarray:
+        """ Grab a buffer of readings from the device in a single transfer
+
+        Parameters
+        ----------
+        n: int
+            strictly positive number of readings, if None the current trigger count is used
+        Returns
+        -------
+        np.ndarray: 1D array of the readings, quantized to the resolution within the range
+        """
+        if not self.is_open:
+            raise TimeoutError
+        if n is None:
+            n = self._trigger_count
+        elif n < 1:
+            raise ValueError(f'Cannot get {n} readings. It should be strictly positive')
+        return np.floor(self._range / self._resolution * self._rng.random(n)) * self._resolution
+
     def reset(self):
         if not self.is_open:
             raise TimeoutError
@@ -2,10 +2,12 @@ import numpy as np
 
 
 from pymodaq.utils.math_utils import gauss1D
-from typing import List, Union
+from typing import Callable, Dict, List, Mapping, Union
 from collections.abc import Iterable
+from types import MappingProxyType
 from numbers import Number
 import math
+import threading
 from time import perf_counter
 
 
@@ -14,9 +16,11 @@ class Spectrometer:
 
     Allows to change the used grating, to move the grating by setting the central wavelength and get the data out of it
     """
-    gratings = ['G300', 'G1200']
+    dispersions = {'G300': 0.7, 'G1200': 0.25}  # grating registry: dispersion in nm per pixel
+    gratings = list(dispersions)
 
-    Nx = 256
+    average_chunk = 64  # maximum number of spectra held in memory when averaging
+    samples_chunk = 65536  # maximum number of monochromator samples held in memory when averaging
     infos = 'Spectrometer Controller Wrapper 0.1.0'
 
     def __init__(self):
@@ -39,6 +43,31 @@ class Spectrometer:
 
         self._lambda0 = 528
 
+        self._arrival_timer: threading.Timer = None  # sets the completion event of the current motion
+
+        self._rng = np.random.default_rng()
+
+        self._exposure = 0.  # s
+        self._abort_acquisition = threading.Event()
+
+        self._Nx = 256
+        self._roi = (0, self._Nx)  # (start, stop) pixels read out along the dispersion axis
+        self._binning = 1
+        self._pixel_offsets = self._build_pixel_offsets()
+        self._wavelength_axis = None  # cached wavelength axis
+        self._wavelength_axis_key = None
+
+        self._response = None  # cached noiseless response over the wavelength axis
+        self._response_key = None
+
+        self._Ny = 128
+        self._vertical_roi = (0, self._Ny)
+        self._vertical_binning = 1
+        self._vertical_profile = None  # cached binned vertical profile of the image and its axis
+        self._vertical_axis = None
+        self._vertical_profile_key = None
+        self._image_row = np.empty((self.n_pixels,))  # workspace holding the spectrum of an image
+
     def open_communication(self):
         return True
 
@@ -46,7 +75,74 @@ class Spectrometer:
         return True
 
     def stop(self):
+        self.get_wavelength()  # freeze the grating where it is now
         self._moving = False
+        if self._arrival_timer is not None:
+            self._arrival_timer.cancel()
+
+    @property
+    def exposure(self):
+        """Get/Set the exposure time in seconds of the asynchronous acquisition"""
+        return self._exposure
+
+    @exposure.setter
+    def exposure(self, value):
+        if value < 0:
+            raise ValueError(f'An exposure of {value} is not possible. It should be positive')
+        self._exposure = value
+
+    def start_acquisition(self, callback: Callable[[np.ndarray], None], n_frames: int = 1,
+                          out: np.ndarray = None, error_callback: Callable[[Exception], None] = None):
+        """Start an asynchronous acquisition of the average of n_frames spectra
+
+        The exposure of the n_frames spectra is simulated in a background thread, which then calls callback with the
+        averaged spectrum. The call returns immediately. Starting an acquisition aborts the running one, as does a
+        change of the sensor size, ROI or binning, whose spectrum would no longer match the readout.
+
+        Parameters
+        ----------
+        callback: callable
+            Called from the acquisition thread with the spectrum as argument, once the acquisition is done
+        n_frames: int
+            The number of spectra to average
+        out: ndarray, optional
+            Preallocated float64 array of shape (n_pixels,) the averaged spectrum is written into
+        error_callback: callable, optional
+            Called from the acquisition thread with the raised exception as argument if the acquisition failed. If
+            None, the exception is raised in the acquisition thread
+        """
+        if n_frames < 1:
+            raise ValueError(f'Cannot grab {n_frames} spectra. It should be strictly positive')
+        if out is None:
+            out = np.empty((self.n_pixels,))
+        else:
+            self._check_out(out, (self.n_pixels,))
+        self.abort_acquisition()
+        self._abort_acquisition = threading.Event()
+        threading.Thread(target=self._acquire,
+                         args=(callback, n_frames, out, self._abort_acquisition, error_callback),
+                         daemon=True).start()
+
+    def _acquire(self, callback: Callable[[np.ndarray], None], n_frames: int, out: np.ndarray,
+                 abort: threading.Event, error_callback: Callable[[Exception], None] = None):
+        """Producer of the asynchronous acquisition, run in its own thread"""
+        if abort.wait(n_frames * self._exposure):
+            return
+        try:
+            self.grab_average(n_frames, out=out)
+        except Exception as e:
+            if abort.is_set():  # the readout changed during the acquisition
+                return
+            if error_callback is None:
+                raise
+            error_callback(e)
+            return
+        if not abort.is_set():
+            callback(out)
+
+    def abort_acquisition(self):
+        """Abort the running asynchronous acquisition, its callback will not be called"""
+        self._abort_acquisition.set()
 
     @property
     def tau(self):
@@ -72,6 +168,127 @@ class Spectrometer:
         else:
             self._tau = value
 
+    @property
+    def Nx(self) -> int:
+        """Get/Set the number of pixels of the sensor along the dispersion axis, resetting the ROI to the full
+        sensor"""
+        return self._Nx
+
+    @Nx.setter
+    def Nx(self, value: int):
+        if value < 1:
+            raise ValueError(f'A sensor of {value} pixels is not possible. It should be strictly positive')
+        if value < self._binning:
+            raise ValueError(f'A sensor of {value} pixels is not possible with a binning of {self._binning}')
+        self._Nx = int(value)
+        self._roi = (0, self._Nx)
+        self._update_readout()
+
+    @property
+    def roi(self) -> tuple:
+        """Get/Set the (start, stop) pixels of the sensor read out along the dispersion axis"""
+        return self._roi
+
+    @roi.setter
+    def roi(self, roi: tuple):
+        start, stop = roi
+        if not 0 <= start < stop <= self._Nx:
+            raise ValueError(f'The ROI {roi} is not possible. It should be within the {self._Nx} sensor pixels')
+        if stop - start < self._binning:
+            raise ValueError(f'The ROI {roi} is not possible. It should be at least {self._binning} pixels wide, '
+                             f'the binning')
+        self._roi = (int(start), int(stop))
+        self._update_readout()
+
+    @property
+    def binning(self) -> int:
+        """Get/Set the number of adjacent pixels of the ROI summed together on the sensor before readout"""
+        return self._binning
+
+    @binning.setter
+    def binning(self, value: int):
+        if value < 1:
+            raise ValueError(f'A binning of {value} is not possible. It should be strictly positive')
+        start, stop = self._roi
+        if value > stop - start:
+            raise ValueError(f'A binning of {value} is not possible. It should be at most the {stop - start} pixels '
+                             f'of the ROI')
+        self._binning = int(value)
+        self._update_readout()
+
+    @property
+    def n_pixels(self) -> int:
+        """Get the number of (binned) pixels read out, the length of the spectra (remaining ROI pixels are dropped)"""
+        start, stop = self._roi
+        return (stop - start) // self._binning
+
+    def _update_readout(self):
+        """Rebuild what depends on the sensor size, ROI or binning"""
+        self.abort_acquisition()
+        self._pixel_offsets = self._build_pixel_offsets()
+        self._wavelength_axis_key = None
+        self._invalidate_response()
+
+    @property
+    def Ny(self) -> int:
+        """Get/Set the number of rows of the sensor, resetting the vertical ROI to the full sensor"""
+        return self._Ny
+
+    @Ny.setter
+    def Ny(self, value: int):
+        if value < 1:
+            raise ValueError(f'A sensor of {value} rows is not possible. It should be strictly positive')
+        if value < self._vertical_binning:
+            raise ValueError(f'A sensor of {value} rows is not possible with a binning of {self._vertical_binning}')
+        self._Ny = int(value)
+        self._vertical_roi = (0, self._Ny)
+
+    @property
+    def vertical_roi(self) -> tuple:
+        """Get/Set the (start, stop) rows of the sensor read out by grab_image"""
+        return self._vertical_roi
+
+    @vertical_roi.setter
+    def vertical_roi(self, roi: tuple):
+        start, stop = roi
+        if not 0 <= start < stop <= self._Ny:
+            raise ValueError(f'The ROI {roi} is not possible. It should be within the {self._Ny} sensor rows')
+        if stop - start < self._vertical_binning:
+            raise ValueError(f'The ROI {roi} is not possible. It should be at least {self._vertical_binning} rows '
+                             f'high, the binning')
+        self._vertical_roi = (int(start), int(stop))
+
+    @property
+    def vertical_binning(self) -> int:
+        """Get/Set the number of adjacent rows summed together by grab_image"""
+        return self._vertical_binning
+
+    @vertical_binning.setter
+    def vertical_binning(self, value: int):
+        if value < 1:
+            raise ValueError(f'A binning of {value} is not possible. It should be strictly positive')
+        start, stop = self._vertical_roi
+        if value > stop - start:
+            raise ValueError(f'A binning of {value} is not possible. It should be at most the {stop - start} rows '
+                             f'of the ROI')
+        self._vertical_binning = int(value)
+
+    def _build_pixel_offsets(self) -> Dict[str, np.ndarray]:
+        """Compute for each grating the read-only wavelength offsets of the read out (binned) pixels from the central
+        wavelength, a binned pixel being at the center of the pixels it sums"""
+        pixels = self._roi[0] + np.arange(self.n_pixels) * self._binning + (self._binning - 1) / 2 - self.Nx / 2
+        offsets = {}
+        for grating, dispersion in self.dispersions.items():
+            offsets[grating] = pixels * dispersion
+            offsets[grating].flags.writeable = False
+        return offsets
+
+    @property
+    def pixel_offsets(self) -> Mapping[str, np.ndarray]:
+        """Get the read-only table of the read out pixel wavelength offsets (in nm) from the central wavelength per
+        grating"""
+        return MappingProxyType(self._pixel_offsets)
+
     @property
     def grating(self):
         """Get.set the current grating in the spectrometer"""
@@ -81,6 +298,7 @@ class Spectrometer:
     def grating(self, grat):
         if grat in self.gratings:
             self._grating = grat
+            self._invalidate_response()
 
     @property
     def amplitude(self):
@@ -93,6 +311,7 @@ class Spectrometer:
             self._amp = value
         if value > 100:
             self._amp = 100
+        self._invalidate_response()
 
     @property
     def noise(self):
@@ -113,21 +332,46 @@ class Spectrometer:
     def width(self, value):
         if value > 0.:
             self._wh = value
+            self._invalidate_response()
 
-    def find_reference(self):
-        """Simulate the moving of the grating into a known "limit" for absolute positioning"""
-        self.set_wavelength(600, 'abs')
+    def find_reference(self, callback: Callable[[threading.Event], None] = None, epsilon: float = None) -> threading.Event:
+        """Simulate the moving of the grating into a known "limit" for absolute positioning
 
-    def set_wavelength(self, value, set_type='abs'):
-        """Move the grating to set the central wavelength out of the spectrometer"""
+        See set_wavelength for the arguments and returned completion event
+        """
+        return self.set_wavelength(600, 'abs', callback=callback, epsilon=epsilon)
+
+    def set_wavelength(self, value, set_type='abs', callback: Callable[[threading.Event], None] = None,
+                       epsilon: float = None) -> threading.Event:
+        """Move the grating to set the central wavelength out of the spectrometer
+
+        Parameters
+        ----------
+        value: float
+            The target (abs) or the displacement (rel) of the central wavelength in nm
+        set_type: str
+            Either 'abs' or 'rel'
+        callback: callable, optional
+            Called from a timer thread when the motion is completed, with the returned completion event as argument,
+            identifying the completed motion
+        epsilon: float, optional
+            Tolerance in nm defining the completion of the motion, see time_to_reach
+
+        Returns
+        -------
+        threading.Event: set when the motion is completed, never set if the motion is stopped or superseded by
+        another one
+        """
         if set_type == 'abs' and value < 0:
             raise ValueError('Wavelength cannot be negative')
+        if self._arrival_timer is not None:
+            self._arrival_timer.cancel()
+        self._init_value = self.get_wavelength()  # the motion starts from where the grating is now
         if set_type == 'abs':
             self._target_lambda = value
         else:
-            self._target_lambda = self._lambda + value
+            self._target_lambda = self._init_value + value
 
-        self._init_value = self._lambda
         if self._init_value != self._target_lambda:
             self._alpha = math.fabs(math.log(self._espilon / math.fabs(self._init_value - self._target_lambda)))
         else:
@@ -135,23 +379,90 @@ class Spectrometer:
         self._start_time = perf_counter()
         self._moving = True
 
+        arrived = threading.Event()
+        self._arrival_timer = threading.Timer(self.time_to_reach(epsilon), self._arrive, args=(arrived, callback))
+        self._arrival_timer.daemon = True
+        self._arrival_timer.start()
+        return arrived
+
+    @staticmethod
+    def _arrive(arrived: threading.Event, callback: Callable[[threading.Event], None] = None):
+        """Completion of a motion, run in the arrival timer thread"""
+        arrived.set()
+        if callback is not None:
+            callback(arrived)
+
     def get_wavelength(self):
         """Get the current central wavelength in the spectrometer"""
         if self._moving:
             curr_time = perf_counter()
-            self._lambda = \
+            wavelength = \
                 math.exp(- self._alpha * (curr_time-self._start_time) / self._tau) *\
                 (self._init_value - self._target_lambda) + self._target_lambda
+            if wavelength != self._lambda:
+                self._lambda = wavelength
+                self._invalidate_response()
         return self._lambda
 
+    def predict_wavelength(self, timestamps: Union[float, np.ndarray]) -> np.ndarray:
+        """Predict the central wavelength at given times from the closed form of the current motion
+
+        Parameters
+        ----------
+        timestamps: float or ndarray
+            Times in seconds, in the time base of time.perf_counter
+
+        Returns
+        -------
+        ndarray: the central wavelengths in nm, of the shape of timestamps
+        """
+        timestamps = np.asarray(timestamps, dtype=float)
+        if not self._moving:
+            return np.full(timestamps.shape, self._lambda, dtype=float)
+        elapsed = np.maximum(timestamps - self._start_time, 0.)
+        return (np.exp(- self._alpha / self._tau * elapsed) * (self._init_value - self._target_lambda)
+                + self._target_lambda)
+
+    def time_to_reach(self, epsilon: float = None) -> float:
+        """Get the time left before the central wavelength is within epsilon of the target
+
+        Derived from the exponential approach: the distance to the target is divided by exp(alpha) every tau seconds
+
+        Parameters
+        ----------
+        epsilon: float
+            Tolerance in nm on the target wavelength, default to the one the motion is computed with
+
+        Returns
+        -------
+        float: the time in seconds, 0 if not moving or already within epsilon
+        """
+        if epsilon is None:
+            epsilon = self._espilon
+        if epsilon <= 0:
+            raise ValueError(f'A tolerance of {epsilon} is not possible. It should be strictly positive')
+        distance = math.fabs(self._init_value - self._target_lambda) if self._moving else 0.
+        if distance <= epsilon:
+            return 0.
+        arrival = self._tau / self._alpha * math.log(distance / epsilon)
+        return max(0., arrival - (perf_counter() - self._start_time))
+
     def get_wavelength_axis(self):
         """Get the wavelength axis out of the spectrometer (dependent of the central wavelength (grating position))
-        and dispersion of the selected grating"""
-        if self._grating == 'G300':
-            coeff = 0.7
-        elif self._grating == 'G1200':
-            coeff = 0.25
-        return (np.linspace(0, self.Nx, self.Nx, endpoint=False) - self.Nx / 2) * coeff + self._lambda
+        and dispersion of the selected grating
+
+        The returned read-only array is the same object as long as the grating and central wavelength are unchanged.
+        During a motion, the central wavelength is refreshed first, the axis following the grating even if
+        get_wavelength is not polled
+        """
+        if self._moving:
+            self.get_wavelength()
+        key = (self._grating, self._lambda)
+        if key != self._wavelength_axis_key:
+            self._wavelength_axis = self._pixel_offsets[self._grating] + self._lambda
+            self._wavelength_axis.flags.writeable = False
+            self._wavelength_axis_key = key
+        return self._wavelength_axis
 
     @property
     def data_wavelength(self,):
@@ -164,6 +475,32 @@ class Spectrometer:
         if lambda0 < 0:
             raise ValueError('Wavelength cannot be negative')
         self._lambda0 = lambda0
+        self._invalidate_response()
+
+    def _invalidate_response(self):
+        """Clear the cached noiseless response, to be called whenever one of its parameters changes"""
+        self._response = None
+        self._response_key = None
+
+    def _get_cached_response(self) -> np.ndarray:
+        """Noiseless response over the current wavelength axis
+
+        The response is only computed again if the amplitude, width, data wavelength, grating or central wavelength
+        changed since the last call. It is only evaluated on the read out pixels, a binned pixel collecting the
+        response of all the pixels it sums.
+
+        Returns
+        -------
+        ndarray: read-only array of length n_pixels
+        """
+        wavelength_axis = self.get_wavelength_axis()  # refreshes the central wavelength during a motion
+        key = (self._amp, self._wh, self._lambda0, self._grating, self._lambda)
+        if self._response is None or key != self._response_key:
+            self._response = self._get_response(wavelength_axis)
+            self._response *= self._binning
+            self._response.flags.writeable = False
+            self._response_key = key
+        return self._response
 
     def _set_data_response(self, lambda_axis: Union[float, Iterable] = 515.) -> np.ndarray:
         """Defines the wavelength response of the physical process measured by our spectrometer
@@ -185,9 +522,21 @@ class Spectrometer:
                 if not isinstance(lambda_axis[0], Number):
                     raise TypeError('lambda_axis should be an iterable of float')
 
+        return self._get_response(lambda_axis) + self._noise * self._rng.random(len(lambda_axis))
+
+    def _get_response(self, lambda_axis: np.ndarray) -> np.ndarray:
+        """Noiseless wavelength response of the physical process measured by our spectrometer
+
+        Parameters
+        ----------
+        lambda_axis: ndarray of floats
+
+        Returns
+        -------
+        ndarray
+        """
         return (self._amp * gauss1D(lambda_axis, self._lambda0, self._wh * (1 + self._amp/10))
-                * (1+0.5 * np.sin(self._amp/10) * np.sin((lambda_axis-self._lambda0) / (self._wh)))
-                + self._noise * np.random.rand(len(lambda_axis)))
+                * (1+0.5 * np.sin(self._amp/10) * np.sin((lambda_axis-self._lambda0) / (self._wh))))
 
     def _get_data_0D(self, data=None):
         """Get the data at the central wavelength of the spectrometer"""
@@ -199,19 +548,173 @@ class Spectrometer:
         """Get the data as a function of the wavelength axis of the spectrometer
         """
         if data is None:
-            data = self._set_data_response(self.get_wavelength_axis())
+            data = self._fill_spectra(np.empty((self.n_pixels,)))
         return data
 
-    def grab_spectrum(self):
-        """get the intensity spectrum out of the spectrometer"""
-        return self._get_data_1D()
+    def _fill_spectra(self, out: np.ndarray) -> np.ndarray:
+        """Write noisy spectra in place into out, of shape (..., n_pixels), without allocating any temporary array
 
-    def grab_image(self):
-        y_axis_array = np.linspace(0, 127, 128)
-        data1D = self._get_data_1D()
-        data2D = np.outer(gauss1D(y_axis_array, np.mean(y_axis_array), 50), data1D)
-        return data2D
+        As for a hardware binning, the read noise is added once per read out pixel whatever the binning
+        """
+        self._rng.random(out=out)
+        out *= self._noise
+        out += self._get_cached_response()
+        return out
+
+    @staticmethod
+    def _check_out(out: np.ndarray, shape: tuple):
+        if out.shape != shape or out.dtype != np.float64 or not out.flags.c_contiguous:
+            raise ValueError(f'out should be a contiguous float64 array of shape {shape}')
+
+    def grab_spectrum(self, out: np.ndarray = None) -> np.ndarray:
+        """get the intensity spectrum out of the spectrometer
+
+        Parameters
+        ----------
+        out: ndarray, optional
+            Preallocated float64 array of shape (n_pixels,) the spectrum is written into. If given, no memory is
+            allocated
+
+        Returns
+        -------
+        ndarray: the spectrum (out if it was given)
+        """
+        if out is None:
+            return self._get_data_1D()
+        self._check_out(out, (self.n_pixels,))
+        return self._fill_spectra(out)
+
+    def grab_spectra(self, n_frames: int = 1, out: np.ndarray = None) -> np.ndarray:
+        """get a batch of successive intensity spectra out of the spectrometer
+
+        The noiseless response is evaluated once for the whole batch and the noise of all frames is drawn in a
+        single block
+
+        Parameters
+        ----------
+        n_frames: int
+            The number of spectra to acquire
+        out: ndarray, optional
+            Preallocated float64 array of shape (n_frames, n_pixels) the spectra are written into
+
+        Returns
+        -------
+        ndarray: a contiguous array of shape (n_frames, n_pixels) (out if it was given)
+        """
+        if n_frames < 1:
+            raise ValueError(f'Cannot grab {n_frames} spectra. It should be strictly positive')
+        if out is None:
+            out = np.empty((n_frames, self.n_pixels))
+        else:
+            self._check_out(out, (n_frames, self.n_pixels))
+        return self._fill_spectra(out)
+
+    def grab_average(self, n_frames: int = 1, out: np.ndarray = None) -> np.ndarray:
+        """get the average of successive intensity spectra out of the spectrometer
+
+        The spectra are grabbed by batches of at most average_chunk frames and summed into a running accumulator, so
+        that the n_frames spectra are never all in memory
+
+        Parameters
+        ----------
+        n_frames: int
+            The number of spectra to average
+        out: ndarray, optional
+            Preallocated float64 array of shape (n_pixels,) the averaged spectrum is written into
+
+        Returns
+        -------
+        ndarray: the averaged spectrum (out if it was given)
+        """
+        if n_frames < 1:
+            raise ValueError(f'Cannot grab {n_frames} spectra. It should be strictly positive')
+        if out is None:
+            out = np.empty((self.n_pixels,))
+        else:
+            self._check_out(out, (self.n_pixels,))
+        if n_frames == 1:
+            return self.grab_spectrum(out=out)
+
+        out[:] = 0.
+        batch = np.empty((min(n_frames, self.average_chunk), self.n_pixels))
+        remaining = n_frames
+        while remaining > 0:
+            n_batch = min(remaining, len(batch))
+            out += self.grab_spectra(n_batch, out=batch[:n_batch]).sum(axis=0)
+            remaining -= n_batch
+        out /= n_frames
+        return out
+
+    def _get_vertical_profile(self) -> np.ndarray:
+        """Binned vertical profile of the illumination over the ROI rows, computed again only if the sensor height,
+        the vertical ROI or binning changed"""
+        key = (self._Ny, self._vertical_roi, self._vertical_binning)
+        if key != self._vertical_profile_key:
+            start, stop = self._vertical_roi
+            n_rows = (stop - start) // self._vertical_binning
+            rows = np.arange(start, start + n_rows * self._vertical_binning).reshape((n_rows, -1))
+            self._vertical_profile = gauss1D(rows, (self._Ny - 1) / 2, 50 * self._Ny / 128).sum(axis=1)
+            self._vertical_axis = rows.mean(axis=1)
+            self._vertical_profile_key = key
+        return self._vertical_profile
+
+    def get_vertical_axis(self) -> np.ndarray:
+        """Get the (binned) row positions of the image returned by grab_image"""
+        self._get_vertical_profile()
+        return self._vertical_axis
+
+    def get_image_shape(self) -> tuple:
+        """Get the shape of the image returned by grab_image, given the ROIs and binnings"""
+        return len(self._get_vertical_profile()), self.n_pixels
+
+    def grab_image(self, out: np.ndarray = None) -> np.ndarray:
+        """get the 2D intensity image out of the spectrometer camera
+
+        The rows of the vertical ROI are summed by groups of vertical_binning rows (remaining rows are dropped)
+
+        Parameters
+        ----------
+        out: ndarray, optional
+            Preallocated float64 array of shape get_image_shape() the image is written into
+
+        Returns
+        -------
+        ndarray: the image (out if it was given)
+        """
+        profile = self._get_vertical_profile()
+        if out is None:
+            out = np.empty(self.get_image_shape())
+        else:
+            self._check_out(out, self.get_image_shape())
+        if self._image_row.shape != (self.n_pixels,):
+            self._image_row = np.empty((self.n_pixels,))
+        return np.multiply(profile[:, np.newaxis], self._fill_spectra(self._image_row), out=out)
 
     def grab_monochromator(self):
         """get the intensity at the central wavelength"""
         return self._get_data_0D()
+
+    def grab_monochromator_average(self, n_samples: int = 1) -> np.ndarray:
+        """get the average of successive intensities at the central wavelength
+
+        The noiseless response is evaluated once and the noise of the samples drawn by blocks of at most
+        samples_chunk samples, summed into a running accumulator
+
+        Parameters
+        ----------
+        n_samples: int
+            The number of samples to average
+
+        Returns
+        -------
+        ndarray: the averaged intensity, of shape (1,) as returned by grab_monochromator
+        """
+        if n_samples < 1:
+            raise ValueError(f'Cannot grab {n_samples} samples. It should be strictly positive')
+        noise = 0.
+        remaining = n_samples
+        while remaining > 0:
+            n_block = min(remaining, self.samples_chunk)
+            noise += self._rng.random(n_block).sum()
+            remaining -= n_block
+        return self._get_response(np.array([self.get_wavelength()])) + self._noise * noise / n_samples
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Lazy registry of the instrument plugins of this package
+
+The plugin subpackages no longer import all their modules when imported, a plugin module is only imported when
+accessed as an attribute of its subpackage. The name -> module index is generated at build time by hatch_build.py
+and shipped in the wheel, if missing (source checkout) the subpackage folders are scanned without importing anything.
+"""
+import importlib
+import json
+import pkgutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+PLUGIN_SUBPACKAGES = ('daq_move_plugins',
+                      'daq_viewer_plugins.plugins_0D',
+                      'daq_viewer_plugins.plugins_1D',
+                      'daq_viewer_plugins.plugins_2D')
+
+INDEX_FILE = Path(__file__).parent.joinpath('resources', 'plugin_index.json')
+
+
+def scan_plugin_modules(package_path: Path) -> Dict[str, List[str]]:
+    """Find the module names of each plugin subpackage without importing them"""
+    index = {}
+    for subpackage in PLUGIN_SUBPACKAGES:
+        folder = package_path.joinpath(*subpackage.split('.'))
+        index[subpackage] = sorted(mod.name for mod in pkgutil.iter_modules([str(folder)]))
+    return index
+
+
+@lru_cache(maxsize=None)
+def get_plugin_index() -> Dict[str, List[str]]:
+    """Get the name -> module index of the plugin subpackages, from the build time index if available"""
+    if INDEX_FILE.is_file():
+        with open(INDEX_FILE) as f:
+            return json.load(f)
+    return scan_plugin_modules(Path(__file__).parent)
+
+
+def lazy_plugins(module_name: str, logger) -> Tuple[Callable, Callable]:
+    """Create the module level __getattr__ and __dir__ of a plugin subpackage
+
+    Parameters
+    ----------
+    module_name: str
+        The __name__ of the plugin subpackage
+    logger: logging.Logger
+        Logger used to report plugins that cannot be imported
+
+    Returns
+    -------
+    __getattr__, __dir__: the functions to be set in the subpackage namespace
+    """
+    subpackage = module_name.split('.', 1)[1]
+
+    def __getattr__(name: str):
+        if name in get_plugin_index().get(subpackage, []):
+            try:
+                return importlib.import_module('.' + name, module_name)
+            except Exception as e:
+                logger.warning("{:} plugin couldn't be loaded due to some missing packages or errors: {:}".format(
+                    name, str(e)))
+                raise AttributeError(f'module {module_name!r} has no attribute {name!r}') from e
+        raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+
+    def __dir__() -> List[str]:
+        return sorted(set(importlib.import_module(module_name).__dict__) |
+                      set(get_plugin_index().get(subpackage, [])))
+
+    return __getattr__, __dir__
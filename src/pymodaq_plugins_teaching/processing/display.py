@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Created the 18/10/2026
+
+Throttling and decimation of the data displayed by the 1D viewers of the teaching applications
+"""
+import math
+from time import perf_counter
+from typing import Optional
+
+import numpy as np
+from qtpy import QtCore
+
+from pymodaq_data.data import Axis, DataCalculated, DataWithAxes
+from pymodaq_gui.plotting.data_viewers.viewer1D import Viewer1D
+
+
+def decimate_minmax(dwa: DataWithAxes, n_bins: int) -> DataWithAxes:
+    """Decimate 1D data into n_bins bins keeping the minimum and maximum of each bin
+
+    Peaks and the envelope of the signals are preserved, contrary to a plain subsampling. Data with less than
+    2 * n_bins samples are returned as is.
+
+    Parameters
+    ----------
+    dwa: DataWithAxes
+        1D data
+    n_bins: int
+        Number of bins, typically the width in pixels of the plot
+
+    Returns
+    -------
+    DataWithAxes: the decimated data, with 2 * n_bins samples at most
+    """
+    npts = dwa.size
+    if n_bins < 1 or npts <= 2 * n_bins:
+        return dwa
+    bin_size = math.ceil(npts / n_bins)
+    starts = np.arange(0, npts, bin_size)
+    data = np.stack(dwa.data)
+    decimated = np.empty((len(dwa), 2 * len(starts)))
+    decimated[:, 0::2] = np.minimum.reduceat(data, starts, axis=1)
+    decimated[:, 1::2] = np.maximum.reduceat(data, starts, axis=1)
+
+    axis = dwa.get_axis_from_index(0)[0]
+    axis_data = np.repeat(axis.get_data()[starts], 2)
+    return DataCalculated(dwa.name, data=list(decimated), labels=dwa.labels, units=dwa.units,
+                          axes=[Axis(axis.label, units=axis.units, data=axis_data, index=0)])
+
+
+class DisplayThrottle(QtCore.QObject):
+    """Show data in a Viewer1D at a maximum refresh rate
+
+    Data received faster than rate are coalesced: only the latest one is shown when the display is due, the others
+    being counted in n_coalesced. Traces longer than twice the width in pixels of the viewer are decimated with
+    decimate_minmax before being shown.
+
+    Parameters
+    ----------
+    viewer: Viewer1D
+    rate: float
+        Maximum refresh rate in Hz
+    """
+
+    def __init__(self, viewer: Viewer1D, rate: float = 30.):
+        super().__init__()
+        self.viewer = viewer
+        self.rate = rate
+        self.n_coalesced = 0
+
+        self._pending: Optional[DataWithAxes] = None
+        self._last_display = -math.inf
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._display)
+
+    def show_data(self, dwa: DataWithAxes):
+        """Show dwa now if the last display is old enough, otherwise when the display is due"""
+        if self._pending is not None:
+            self.n_coalesced += 1
+        self._pending = dwa
+        if not self._timer.isActive():
+            delay = self._last_display + 1 / self.rate - perf_counter()
+            if delay <= 0:
+                self._display()
+            else:
+                self._timer.start(math.ceil(delay * 1000))
+
+    def _display(self):
+        dwa, self._pending = self._pending, None
+        if dwa is None:
+            return
+        self._last_display = perf_counter()
+        self.viewer.show_data(decimate_minmax(dwa, self.viewer.parent.width()))
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Created the 18/10/2026
+
+Spectral analysis stages shared by the Generator extension and application
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pymodaq_data.data import Axis, DataCalculated, DataWithAxes
+
+
+def get_sampling(dwa: DataWithAxes) -> Tuple[int, float]:
+    """Get the number of samples and the sampling step of a 1D signal from its (linear) axis"""
+    axis = dwa.get_axis_from_index(0)[0]
+    if axis.is_axis_linear() and axis.scaling is not None:
+        return axis.size, float(axis.scaling)
+    data = axis.get_data()
+    return len(data), float(data[1] - data[0])
+
+
+class FFTMagnitude:
+    """Magnitude of the Fourier transform of real 1D signals
+
+    The one sided transform (rfft) is used, and the angular frequency axis is only built again when the number of
+    samples or the sampling step change, so that a stream of signals of the same sampling is processed without any
+    setup.
+
+    Each call writes the magnitudes into a newly allocated array, owned by the returned DataWithAxes: results can be
+    handed over to another thread and kept for as long as needed.
+    """
+
+    def __init__(self):
+        self._key: Optional[tuple] = None
+        self._axis: Optional[Axis] = None
+
+    def _setup(self, npts: int, delta_t: float, axis: Axis):
+        key = (npts, delta_t, axis.label, axis.units)
+        if key != self._key:
+            omega = 2 * np.pi * np.fft.rfftfreq(npts, delta_t)
+            self._axis = Axis(f'ft({axis.label})', units=f'rad/{axis.units}', data=omega, index=0)
+            self._key = key
+
+    def process(self, dwa: DataWithAxes) -> DataCalculated:
+        """Compute the magnitude of the Fourier transform of the 1D signals of dwa
+
+        Parameters
+        ----------
+        dwa: DataWithAxes
+            Real 1D signals sampled on a linear axis
+
+        Returns
+        -------
+        DataCalculated: the magnitudes as a function of the angular frequency (positive frequencies only)
+        """
+        npts, delta_t = get_sampling(dwa)
+        self._setup(npts, delta_t, dwa.get_axis_from_index(0)[0])
+        magnitudes = np.empty((len(dwa), npts // 2 + 1))
+        for ind, data in enumerate(dwa.data):
+            np.abs(np.fft.rfft(data), out=magnitudes[ind])
+        return DataCalculated(f'FFT_{dwa.name}', data=list(magnitudes), axes=[self._axis], labels=dwa.labels)
+
+
+WINDOWS = {'hann': np.hanning,
+           'hamming': np.hamming,
+           'blackman': np.blackman,
+           'bartlett': np.bartlett,
+           'boxcar': np.ones}
+
+
+class WelchPSD:
+    """Power spectral density of real 1D signals estimated with the Welch method
+
+    Each signal is cut into segments of segment_length samples overlapping by overlap (a fraction, 0 giving the
+    Bartlett method), the segments are windowed and their periodograms averaged, all segments being processed in one
+    vectorized call. Successive estimates are then exponentially averaged with a weight of 1 / n_averaging for the
+    newest one (a plain running mean for the first n_averaging ones), the average being restarted if the sampling,
+    window or segment length changes.
+
+    Parameters
+    ----------
+    window: str
+        One of the WINDOWS keys
+    segment_length: int
+        Number of samples of a segment, clipped to the number of samples of the signals
+    overlap: float
+        Overlap fraction of two successive segments, in [0, 1)
+    n_averaging: int
+        Number of estimates in the exponential averaging across calls
+    """
+
+    def __init__(self, window: str = 'hann', segment_length: int = 256, overlap: float = 0.5,
+                 n_averaging: int = 1):
+        self._window = None
+        self._segment_length = None
+        self._overlap = None
+        self._n_averaging = None
+        self.window = window
+        self.segment_length = segment_length
+        self.overlap = overlap
+        self.n_averaging = n_averaging
+
+        self._key: Optional[tuple] = None
+        self._axis: Optional[Axis] = None
+        self._window_array: Optional[np.ndarray] = None
+        self._scale = 1.
+        self._psd: Optional[np.ndarray] = None
+        self._n_estimates = 0
+
+    @property
+    def window(self) -> str:
+        """Get/Set the name of the window applied to the segments"""
+        return self._window
+
+    @window.setter
+    def window(self, window: str):
+        if window not in WINDOWS:
+            raise ValueError(f'Unknown window {window}, it should be one of {list(WINDOWS)}')
+        self._window = window
+
+    @property
+    def segment_length(self) -> int:
+        """Get/Set the number of samples of a segment"""
+        return self._segment_length
+
+    @segment_length.setter
+    def segment_length(self, value: int):
+        if value < 2:
+            raise ValueError(f'A segment of {value} samples is not possible. It should be at least 2')
+        self._segment_length = int(value)
+
+    @property
+    def overlap(self) -> float:
+        """Get/Set the overlap fraction of two successive segments"""
+        return self._overlap
+
+    @overlap.setter
+    def overlap(self, value: float):
+        if not 0. <= value < 1.:
+            raise ValueError(f'An overlap of {value} is not possible. It should be in [0, 1)')
+        self._overlap = value
+
+    @property
+    def n_averaging(self) -> int:
+        """Get/Set the number of estimates in the exponential averaging across calls"""
+        return self._n_averaging
+
+    @n_averaging.setter
+    def n_averaging(self, value: int):
+        if value < 1:
+            raise ValueError(f'An averaging over {value} estimates is not possible. It should be strictly positive')
+        self._n_averaging = int(value)
+
+    def reset(self):
+        """Restart the exponential averaging"""
+        self._n_estimates = 0
+
+    def _setup(self, npts: int, delta_t: float, n_channels: int, axis: Axis):
+        segment_length = min(self._segment_length, npts)
+        key = (segment_length, delta_t, n_channels, self._window, axis.units)
+        if key != self._key:
+            # periodic version of the window, better suited to spectral analysis than the symmetric one
+            self._window_array = WINDOWS[self._window](segment_length + 1)[:-1]
+            # density scaling, the power of the negative frequencies being folded on the positive ones
+            self._scale = 2 * delta_t / np.sum(self._window_array ** 2)
+            frequencies = np.fft.rfftfreq(segment_length, delta_t)
+            self._axis = Axis('frequency', units='Hz' if axis.units == 's' else f'1/{axis.units}',
+                              data=frequencies, index=0)
+            self._psd = np.zeros((n_channels, len(frequencies)))
+            self._n_estimates = 0
+            self._key = key
+        return segment_length
+
+    def _estimate(self, signals: np.ndarray, segment_length: int) -> np.ndarray:
+        """Welch estimate of the one sided density of signals of shape (n_channels, npts)"""
+        step = max(1, int(round(segment_length * (1 - self._overlap))))
+        segments = np.lib.stride_tricks.sliding_window_view(signals, segment_length, axis=-1)[..., ::step, :]
+        segments = segments - segments.mean(axis=-1, keepdims=True)  # constant detrending of each segment
+        segments *= self._window_array
+        spectra = np.fft.rfft(segments, axis=-1)
+        psd = np.mean(spectra.real ** 2 + spectra.imag ** 2, axis=-2)
+        psd *= self._scale
+        psd[..., 0] /= 2
+        if segment_length % 2 == 0:
+            psd[..., -1] /= 2
+        return psd
+
+    def process(self, dwa: DataWithAxes) -> DataCalculated:
+        """Compute the exponentially averaged power spectral density of the 1D signals of dwa
+
+        Parameters
+        ----------
+        dwa: DataWithAxes
+            Real 1D signals sampled on a linear axis
+
+        Returns
+        -------
+        DataCalculated: the one sided densities as a function of the frequency
+        """
+        npts, delta_t = get_sampling(dwa)
+        segment_length = self._setup(npts, delta_t, len(dwa), dwa.get_axis_from_index(0)[0])
+        psd = self._estimate(np.stack(dwa.data), segment_length)
+        self._n_estimates = min(self._n_estimates + 1, self._n_averaging)
+        self._psd += (psd - self._psd) / self._n_estimates
+        return DataCalculated(f'PSD_{dwa.name}', data=list(self._psd.copy()), axes=[self._axis],
+                              labels=dwa.labels, units=f'{dwa.units}^2/Hz' if dwa.units else '')
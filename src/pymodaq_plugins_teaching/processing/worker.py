@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Created the 18/10/2026
+
+Analysis of the grabbed data out of the GUI thread
+"""
+import threading
+from collections import deque
+from typing import Any, Callable, Optional
+
+from qtpy import QtCore
+
+from pymodaq_utils.logger import set_logger, get_module_name
+
+logger = set_logger(get_module_name(__file__))
+
+
+class AnalysisWorker(QtCore.QObject):
+    """Apply a processing function to submitted data in a background thread
+
+    Submitted data wait in a bounded queue, the oldest ones being dropped when it is full, so that a slow analysis
+    skips stale frames instead of backing up the acquisition. Results are made available to the GUI thread through
+    the result_ready signal, only the latest one being kept.
+
+    Parameters
+    ----------
+    process: callable
+        Called from the worker thread with a submitted data, returns the result
+    maxsize: int
+        Maximum number of data waiting to be processed
+    """
+    result_ready = QtCore.Signal()
+
+    def __init__(self, process: Callable[[Any], Any], maxsize: int = 1):
+        super().__init__()
+        self.process = process
+        self.lock = threading.Lock()  # held while processing, to be taken to modify the processing objects
+        self.n_dropped = 0
+
+        self._queue = deque(maxlen=maxsize)
+        self._condition = threading.Condition()
+        self._result = None
+        self._result_lock = threading.Lock()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, data: Any):
+        """Queue data to be processed, dropping the oldest waiting one if the queue is full"""
+        with self._condition:
+            if len(self._queue) == self._queue.maxlen:
+                self.n_dropped += 1
+            self._queue.append(data)
+            self._condition.notify()
+
+    def take_result(self) -> Optional[Any]:
+        """Get the latest result, or None if it has already been taken"""
+        with self._result_lock:
+            result, self._result = self._result, None
+        return result
+
+    def stop(self, timeout: float = None):
+        """Stop the worker thread once the current processing is done, the waiting data are discarded"""
+        with self._condition:
+            self._running = False
+            self._queue.clear()
+            self._condition.notify()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and len(self._queue) == 0:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                data = self._queue.popleft()
+            try:
+                with self.lock:
+                    result = self.process(data)
+            except Exception as e:
+                logger.exception(f'Analysis failed: {str(e)}')
+                continue
+            with self._result_lock:
+                self._result = result
+            self.result_ready.emit()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Created the 18/10/2026
+
+Throughput of the mock hardware as a function of the number of generated points, using pytest-benchmark (a test
+dependency). These benchmarks are deselected by default (see the pytest options in pyproject.toml), run them and store
+the results as JSON with:
+
+    pytest -m hardware_benchmark --benchmark-json=benchmark.json
+
+or use --benchmark-autosave to save them under .benchmarks/ and --benchmark-compare to compare with a previous run.
+"""
+import math
+
+import pytest
+
+from pymodaq_data import Q_
+
+from pymodaq_plugins_teaching.hardware.spectrometer import Spectrometer
+from pymodaq_plugins_teaching.hardware.generator import Generator
+
+pytestmark = pytest.mark.hardware_benchmark
+
+SIZES = (256, 4096, 65536, 1000000)
+
+
+@pytest.fixture
+def spectro():
+    return Spectrometer()
+
+
+def set_extra_info(benchmark, n_points: int):
+    benchmark.extra_info['n_points'] = n_points
+    benchmark.group = benchmark.name.split('[')[0]
+
+
+@pytest.mark.parametrize('n_points', SIZES)
+def test_grab_spectrum(benchmark, spectro, n_points):
+    spectro.Nx = n_points
+    set_extra_info(benchmark, n_points)
+    spectrum = benchmark(spectro.grab_spectrum)
+    assert spectrum.shape == (n_points,)
+
+
+@pytest.mark.parametrize('n_points', SIZES)
+def test_grab_spectrum_out(benchmark, spectro, n_points):
+    spectro.Nx = n_points
+    set_extra_info(benchmark, n_points)
+    out = spectro.grab_spectrum()
+    assert benchmark(spectro.grab_spectrum, out=out) is out
+
+
+@pytest.mark.parametrize('n_points', SIZES)
+def test_grab_image(benchmark, spectro, n_points):
+    spectro.Nx = spectro.Ny = int(math.sqrt(n_points))
+    set_extra_info(benchmark, spectro.Nx * spectro.Ny)
+    out = spectro.grab_image()
+    assert benchmark(spectro.grab_image, out=out) is out
+
+
+def test_grab_monochromator(benchmark, spectro):
+    """A single point is read out whatever the sensor size"""
+    set_extra_info(benchmark, 1)
+    benchmark(spectro.grab_monochromator)
+
+
+@pytest.mark.parametrize('n_points', SIZES)
+def test_get_waveform(benchmark, n_points):
+    generator = Generator()
+    set_extra_info(benchmark, n_points)
+    time_array, waveform = benchmark(generator.get_waveform, n_points, Q_(1e-5, 's'))
+    assert len(waveform) == n_points
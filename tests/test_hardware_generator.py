@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Created the 18/10/2026
+"""
+import numpy as np
+import pytest
+
+from pymodaq_data import Q_
+
+from pymodaq_plugins_teaching.hardware.generator import Generator, WaveType
+
+
+@pytest.fixture
+def generator():
+    return Generator()
+
+
+@pytest.mark.parametrize('wave_type', WaveType.names())
+def test_get_waveform(generator, wave_type):
+    generator.wave_type = wave_type
+    generator.amplitude = Q_(2., 'V')
+    generator.offset = Q_(1., 'V')
+    time_array, waveform = generator.get_waveform(1000, Q_(1., 'ms'))
+    assert waveform.shape == time_array.shape == (1000,)
+    assert waveform.is_compatible_with('V')
+    assert np.max(waveform.m_as('V')) == pytest.approx(3.)
+    assert np.min(waveform.m_as('V')) == pytest.approx(-1.)
+
+
+@pytest.mark.parametrize('wave_type', (WaveType.TRIANGLE, WaveType.ARBITRARY))
+def test_waveform_in_phase_with_sinus(generator, wave_type):
+    generator.phase = Q_(0.3, 'rad')
+    _, sinus = generator.get_waveform(1000, Q_(1., 'ms'))
+    generator.wave_type = wave_type
+    _, waveform = generator.get_waveform(1000, Q_(1., 'ms'))
+    maxima = np.argmax(sinus.m[:100]), np.argmax(waveform.m[:100])
+    assert maxima[0] == pytest.approx(maxima[1], abs=1)
+
+
+def test_arbitrary_table(generator):
+    generator.wave_type = WaveType.ARBITRARY
+    generator.arbitrary_table = [0., 1., 2., 3.]
+    _, waveform = generator.get_waveform(8, Q_(25., 'ms'))  # 10 Hz: 4 samples per period
+    assert np.allclose(waveform.m_as('V'), [0., 1., 2., 3., 0., 1., 2., 3.])
+
+    with pytest.raises(ValueError):
+        generator.arbitrary_table = [1.]
+
+
+def test_get_waveform_raw(generator):
+    generator.frequency = Q_(50., 'Hz')
+    generator.amplitude = Q_(500., 'mV')
+    time_array, waveform = generator.get_waveform_raw(100, 1e-3)
+    assert waveform.dtype == np.float64
+    assert np.allclose(time_array, np.arange(100) * 1e-3)
+    assert np.allclose(waveform, 0.5 * np.sin(2 * np.pi * 50 * time_array))
+
+    time_q, waveform_q = generator.get_waveform(100, Q_(1., 'ms'))
+    assert np.allclose(waveform_q.m_as('V'), waveform)
+    assert generator.amplitude.m_as('V') == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize('wave_type', WaveType.names())
+def test_stream_is_continuous(generator, wave_type):
+    generator.wave_type = wave_type
+    generator.frequency = Q_(13., 'Hz')
+    time_array, waveform = generator.get_waveform_raw(1000, 1e-3)
+
+    stream = generator.stream(100, 1e-3)
+    chunks = [next(stream) for _ in range(10)]
+    assert [chunk[0] for chunk in chunks] == list(range(0, 1000, 100))
+    assert np.allclose(np.concatenate([chunk[1] for chunk in chunks]), time_array)
+    assert np.allclose(np.concatenate([chunk[2] for chunk in chunks]), waveform)
+
+
+
+def test_stream_frequency_change(generator):
+    generator.frequency = Q_(10., 'Hz')
+    stream = generator.stream(125, 1e-3)
+    next(stream)  # 1.25 periods at 10 Hz
+    generator.frequency = Q_(37., 'Hz')
+    _, _, waveform = next(stream)
+    expected = np.sin(2 * np.pi * (0.25 + 37 * 1e-3 * np.arange(125)))
+    assert np.allclose(waveform, expected)
+
+    next_start = (0.25 + 37 * 1e-3 * 125) % 1.
+    assert next(stream)[2][0] == pytest.approx(np.sin(2 * np.pi * next_start))
+
+
+def test_sampling_state(generator):
+    generator.set_sampling(1000, 1e-4)
+    time_array, waveform = generator.get_waveform_raw()
+    assert generator.npts == 1000 and generator.dt == 1e-4
+    assert time_array is generator.time_base and not time_array.flags.writeable
+    assert np.allclose(time_array, np.arange(1000) * 1e-4)
+    assert np.allclose(waveform, np.sin(2 * np.pi * 10 * time_array))
+
+    generator.frequency = Q_(50, 'Hz')
+    assert np.allclose(generator.get_waveform_raw()[1], np.sin(2 * np.pi * 50 * time_array))
+    assert generator.get_waveform_raw()[0] is time_array
+
+    generator.get_waveform_raw(200, 1e-3)
+    assert generator.npts == 200 and generator.time_base is not time_array
+    with pytest.raises(ValueError):
+        generator.set_sampling(0, 1e-3)
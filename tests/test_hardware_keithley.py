@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Created the 18/10/2026
+"""
+import numpy as np
+import pytest
+
+from pymodaq_plugins_teaching.hardware.keithley import Keithley2110
+from pymodaq_plugins_teaching.hardware.serial_addresses import SerialAddresses
+
+
+@pytest.fixture
+def meter():
+    return Keithley2110(SerialAddresses.names()[0])
+
+
+def test_get_readings(meter):
+    meter.set_function_parameters('volt_dc', rng=10., resolution=1e-3)
+    readings = meter.get_readings(1000)
+    assert readings.shape == (1000,)
+    assert np.all((readings >= 0.) & (readings < 10.))
+    assert np.allclose(readings / 1e-3, np.round(readings / 1e-3))  # quantized to the resolution
+
+
+def test_get_readings_trigger_count(meter):
+    assert meter.get_readings().shape == (1,)
+    assert meter.set_trigger_count(50) == meter.get_trigger_count() == 50
+    assert meter.get_readings().shape == (50,)
+    with pytest.raises(ValueError):
+        meter.set_trigger_count(0)
+
+
+@pytest.mark.parametrize('n', (0, -5))
+def test_get_readings_invalid(meter, n):
+    with pytest.raises(ValueError):
+        meter.get_readings(n)
+
+
+def test_get_readings_closed():
+    with pytest.raises(TimeoutError):
+        Keithley2110().get_readings()
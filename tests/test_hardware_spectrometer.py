@@ -4,3 +4,280 @@ Created the 09/10/2022
 
 @author: Sebastien Weber
 """
+import threading
+from time import perf_counter, sleep
+
+import numpy as np
+import pytest
+
+from pymodaq_plugins_teaching.hardware.spectrometer import Spectrometer
+
+
+@pytest.fixture
+def spectro():
+    return Spectrometer()
+
+
+def test_grab_spectra_shape(spectro):
+    spectra = spectro.grab_spectra(10)
+    assert spectra.shape == (10, spectro.Nx)
+    assert spectra.flags['C_CONTIGUOUS']
+
+
+def test_grab_spectra_noise(spectro):
+    spectro.noise = 0.5
+    spectra = spectro.grab_spectra(1000)
+    baseline = spectro._get_response(spectro.get_wavelength_axis())
+    assert np.all(spectra >= baseline)
+    assert np.all(spectra <= baseline + spectro.noise)
+    assert np.allclose(spectra.mean(axis=0), baseline + spectro.noise / 2, atol=0.05)
+
+
+def test_grab_spectra_invalid(spectro):
+    with pytest.raises(ValueError):
+        spectro.grab_spectra(0)
+
+
+def test_response_cache(spectro):
+    response = spectro._get_cached_response()
+    assert spectro._get_cached_response() is response
+    assert not response.flags.writeable
+
+    for name, value in (('amplitude', 20), ('width', 5), ('data_wavelength', 540), ('grating', 'G1200')):
+        setattr(spectro, name, value)
+        new_response = spectro._get_cached_response()
+        assert new_response is not response
+        assert np.allclose(new_response, spectro._get_response(spectro.get_wavelength_axis()))
+        response = new_response
+
+
+@pytest.mark.parametrize('grating', Spectrometer.gratings)
+def test_wavelength_axis(spectro, grating):
+    spectro.grating = grating
+    dispersion = Spectrometer.dispersions[grating]
+    expected = (np.linspace(0, spectro.Nx, spectro.Nx, endpoint=False) - spectro.Nx / 2) * dispersion + 532
+    assert np.allclose(spectro.get_wavelength_axis(), expected)
+
+
+def test_pixel_offsets_read_only(spectro):
+    with pytest.raises(TypeError):
+        spectro.pixel_offsets['G300'] = np.zeros((spectro.Nx,))
+    with pytest.raises(ValueError):
+        spectro.pixel_offsets['G300'][0] = 1.
+
+
+def test_grab_spectrum_out(spectro):
+    out = np.empty((spectro.Nx,))
+    assert spectro.grab_spectrum(out=out) is out
+    response = spectro._get_cached_response()
+    assert np.all(out >= response) and np.all(out <= response + spectro.noise)
+
+    out = np.empty((5, spectro.Nx))
+    assert spectro.grab_spectra(5, out=out) is out
+
+    with pytest.raises(ValueError):
+        spectro.grab_spectrum(out=np.empty((spectro.Nx + 1,)))
+    with pytest.raises(ValueError):
+        spectro.grab_spectrum(out=np.empty((spectro.Nx,), dtype=np.float32))
+
+
+def test_start_acquisition(spectro):
+    done = threading.Event()
+    spectra = []
+
+    def callback(spectrum):
+        spectra.append(spectrum)
+        done.set()
+
+    spectro.exposure = 0.01
+    out = np.empty((spectro.Nx,))
+    spectro.start_acquisition(callback, 5, out=out)
+    assert done.wait(2)
+    assert spectra[0] is out
+
+    done.clear()
+    spectro.exposure = 0.2
+    spectro.start_acquisition(callback)
+    spectro.abort_acquisition()
+    assert not done.wait(0.4)
+
+
+def test_start_acquisition_exclusive(spectro):
+    spectra = []
+
+    spectro.exposure = 0.1
+    spectro.start_acquisition(spectra.append)
+    spectro.start_acquisition(spectra.append)  # aborts the first one
+    sleep(0.4)
+    assert len(spectra) == 1
+
+
+def test_start_acquisition_readout_change(spectro):
+    done = threading.Event()
+    errors = []
+
+    spectro.exposure = 0.1
+    spectro.start_acquisition(lambda spectrum: done.set(), out=np.empty((spectro.n_pixels,)),
+                              error_callback=errors.append)
+    spectro.binning = 2  # the pending spectrum no longer matches the readout: the acquisition is aborted
+    assert not done.wait(0.3)
+    assert errors == []
+
+
+def test_start_acquisition_error(spectro, monkeypatch):
+    done = threading.Event()
+    errors = []
+
+    def error_callback(error):
+        errors.append(error)
+        done.set()
+
+    def grab_average(n_frames, out=None):
+        raise RuntimeError('readout failure')
+
+    monkeypatch.setattr(spectro, 'grab_average', grab_average)
+    spectro.start_acquisition(lambda spectrum: None, error_callback=error_callback)
+    assert done.wait(2)
+    assert isinstance(errors[0], RuntimeError)
+
+
+@pytest.mark.parametrize('n_frames', (1, 10, 1000))
+def test_grab_average(spectro, n_frames):
+    spectro.average_chunk = 64
+    average = spectro.grab_average(n_frames)
+    response = spectro._get_cached_response()
+    assert average.shape == (spectro.Nx,)
+    assert np.all(average >= response) and np.all(average <= response + spectro.noise)
+    if n_frames == 1000:
+        assert np.allclose(average, response + spectro.noise / 2, atol=0.05)
+
+
+@pytest.mark.parametrize('n_samples', (1, 10, 100000))
+def test_grab_monochromator_average(spectro, n_samples):
+    spectro.samples_chunk = 1000
+    average = spectro.grab_monochromator_average(n_samples)
+    response = spectro._get_response(np.array([spectro.get_wavelength()]))
+    assert average.shape == spectro.grab_monochromator().shape == (1,)
+    assert response <= average[0] <= response + spectro.noise
+    if n_samples == 100000:
+        assert average[0] == pytest.approx(response[0] + spectro.noise / 2, abs=0.01)
+    with pytest.raises(ValueError):
+        spectro.grab_monochromator_average(0)
+
+
+def test_grab_image(spectro):
+    image = spectro.grab_image()
+    assert image.shape == spectro.get_image_shape() == (spectro.Ny, spectro.Nx)
+
+    spectro.Nx = 512
+    spectro.Ny = 64
+    spectro.vertical_roi = (10, 50)
+    spectro.vertical_binning = 3
+    assert spectro.get_image_shape() == (13, 512)
+    assert spectro.get_vertical_axis().shape == (13,)
+    out = np.empty((13, 512))
+    assert spectro.grab_image(out=out) is out
+
+    with pytest.raises(ValueError):
+        spectro.grab_image(out=np.empty((64, 512)))
+    with pytest.raises(ValueError):
+        spectro.vertical_roi = (50, 10)
+    with pytest.raises(ValueError):
+        spectro.vertical_binning = 41
+    with pytest.raises(ValueError):
+        spectro.vertical_roi = (10, 12)
+
+
+def test_roi_binning(spectro):
+    full_axis = spectro.get_wavelength_axis().copy()
+    full_response = spectro._get_cached_response().copy()
+
+    spectro.roi = (100, 200)
+    spectro.binning = 4
+    assert spectro.n_pixels == 25
+    assert spectro.grab_spectrum().shape == (25,)
+    assert spectro.grab_spectra(3).shape == (3, 25)
+    assert spectro.grab_image().shape == (spectro.Ny, 25)
+    assert np.allclose(spectro.get_wavelength_axis(), full_axis[100:200].reshape((25, 4)).mean(axis=1))
+    # the binned pixels collect the signal of the pixels they sum
+    assert spectro._get_cached_response().sum() == pytest.approx(full_response[100:200].sum(), rel=1e-3)
+
+    with pytest.raises(ValueError):
+        spectro.roi = (200, 300)
+    with pytest.raises(ValueError):
+        spectro.binning = 0
+
+    spectro.Nx = 128
+    assert spectro.roi == (0, 128)
+    assert spectro.n_pixels == 32
+
+    # a binned pixel never reaches past the ROI
+    spectro.Nx = 256
+    spectro.roi = (250, 256)
+    with pytest.raises(ValueError):
+        spectro.binning = 10
+    with pytest.raises(ValueError):
+        spectro.roi = (0, 2)
+    with pytest.raises(ValueError):
+        spectro.Nx = 2
+    assert spectro.n_pixels == 1
+
+
+def test_trajectory(spectro):
+    assert spectro.time_to_reach() == 0.
+    assert np.all(spectro.predict_wavelength(np.zeros((3,))) == 532)
+
+    spectro.tau = 0.5
+    spectro.set_wavelength(600)
+    timestamps = spectro._start_time + np.array([0., 0.25, 0.5, 10.])
+    trajectory = spectro.predict_wavelength(timestamps)
+    assert trajectory[0] == pytest.approx(532)
+    assert np.all(np.diff(trajectory) > 0)
+    assert trajectory[2] == pytest.approx(600 - 0.01)  # the motion is computed to be within _espilon after tau
+    assert trajectory[3] == pytest.approx(600)
+
+    now = perf_counter()
+    remaining = spectro.time_to_reach(1.)
+    assert 0. < remaining < 0.5
+    assert 600 - spectro.predict_wavelength(now + remaining) == pytest.approx(1., abs=0.05)
+    assert spectro.time_to_reach(100) == 0.
+    with pytest.raises(ValueError):
+        spectro.time_to_reach(0.)
+
+
+def test_wavelength_axis_during_motion(spectro):
+    """The axis and response follow the grating without polling get_wavelength"""
+    axis = spectro.get_wavelength_axis()
+    center = axis[spectro.n_pixels // 2] - spectro._lambda
+    spectro.tau = 0.5
+    spectro.set_wavelength(600)
+    sleep(0.2)
+    before = perf_counter()
+    moved_axis = spectro.get_wavelength_axis()
+    assert moved_axis is not axis
+    assert spectro.predict_wavelength(before) <= moved_axis[spectro.n_pixels // 2] - center
+    lambda_before = spectro._lambda
+    spectro._get_cached_response()
+    assert spectro._response_key[-1] == spectro._lambda > lambda_before
+    spectro.stop()
+
+
+def test_set_wavelength_completion(spectro):
+    spectro.tau = 0.2
+    called = threading.Event()
+    events = []
+
+    def callback(event):
+        events.append(event)
+        called.set()
+
+    arrived = spectro.set_wavelength(540, callback=callback, epsilon=0.1)
+    assert not arrived.is_set()
+    assert arrived.wait(1) and called.wait(1)
+    assert events == [arrived]
+    assert spectro.get_wavelength() == pytest.approx(540, abs=0.1)
+
+    arrived = spectro.set_wavelength(600)
+    spectro.stop()
+    assert not arrived.wait(0.4)
+    assert spectro.get_wavelength() < 600
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Created the 18/10/2026
+"""
+import numpy as np
+import pytest
+
+from pymodaq_plugins_teaching.daq_viewer_plugins.plugins_1D.daq_1Dviewer_Spectro_Moments import spectral_moments
+
+
+def direct_moments(axis: np.ndarray, spectrum: np.ndarray) -> np.ndarray:
+    """Weighted mean, std, skewness and kurtosis of a single spectrum, computed from their definitions"""
+    weights = spectrum / np.sum(spectrum)
+    mean = np.sum(weights * axis)
+    std = np.sqrt(np.sum(weights * (axis - mean) ** 2))
+    skewness = np.sum(weights * ((axis - mean) / std) ** 3)
+    kurtosis = np.sum(weights * ((axis - mean) / std) ** 4)
+    return np.array([mean, std, skewness, kurtosis])
+
+
+@pytest.fixture
+def axis():
+    return np.linspace(500, 600, 512)
+
+
+def make_spectrum(axis, center, width, tail=0.):
+    """Gaussian line with an optional exponential tail on its red side to make it skewed"""
+    spectrum = np.exp(-((axis - center) / width) ** 2 / 2)
+    if tail:
+        spectrum += 0.5 * np.exp(-(axis - center) / tail) * (axis >= center)
+    return spectrum
+
+
+def test_spectral_moments_1D(axis):
+    spectrum = make_spectrum(axis, 540., 5., tail=10.)
+    moments = spectral_moments(axis, spectrum)
+    assert moments.shape == (4,)
+    assert np.allclose(moments, direct_moments(axis, spectrum))
+
+
+def test_spectral_moments_gaussian(axis):
+    moments = spectral_moments(axis, make_spectrum(axis, 550., 4.))
+    assert moments == pytest.approx([550., 4., 0., 3.], abs=1e-6)
+
+
+def test_spectral_moments_stack(axis):
+    rng = np.random.default_rng(0)
+    spectra = np.stack([make_spectrum(axis, center, width, tail) + 0.01 * rng.random(len(axis))
+                        for center, width, tail in ((520., 3., 0.), (550., 6., 5.), (580., 2., 20.))])
+    moments = spectral_moments(axis, spectra)
+    assert moments.shape == (3, 4)
+    assert np.allclose(moments, [direct_moments(axis, spectrum) for spectrum in spectra])
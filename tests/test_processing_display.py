@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Created the 18/10/2026
+"""
+import numpy as np
+
+from pymodaq_data.data import Axis, DataRaw
+
+from pymodaq_plugins_teaching.processing.display import decimate_minmax, DisplayThrottle
+
+
+def make_trace(npts: int) -> DataRaw:
+    rng = np.random.default_rng(0)
+    return DataRaw('trace', data=[rng.standard_normal(npts), rng.standard_normal(npts)], units='V',
+                   axes=[Axis('Time', units='s', data=np.arange(npts) * 1e-3, index=0)])
+
+
+def test_decimate_minmax():
+    trace = make_trace(100001)
+    decimated = decimate_minmax(trace, 640)
+    assert decimated.size <= 2 * 640
+    assert decimated.units == 'V'
+    for raw, dec in zip(trace.data, decimated.data):
+        assert dec.max() == raw.max() and dec.min() == raw.min()
+    axis = decimated.get_axis_from_index(0)[0].get_data()
+    assert len(axis) == decimated.size and np.all(np.diff(axis) >= 0)
+
+    short = make_trace(1000)
+    assert decimate_minmax(short, 640) is short
+
+
+class FakeViewer:
+    class Widget:
+        @staticmethod
+        def width():
+            return 100
+
+    parent = Widget()
+
+    def __init__(self):
+        self.shown = []
+
+    def show_data(self, dwa):
+        self.shown.append(dwa)
+
+
+def test_display_throttle(qtbot):
+    viewer = FakeViewer()
+    throttle = DisplayThrottle(viewer, rate=10.)
+    traces = [make_trace(1000) for _ in range(5)]
+    for trace in traces:
+        throttle.show_data(trace)
+    assert len(viewer.shown) == 1  # the first one is shown right away, the others are coalesced
+    qtbot.waitUntil(lambda: len(viewer.shown) == 2, timeout=1000)
+    assert throttle.n_coalesced == 3
+    assert viewer.shown[1].size == 200
+    assert np.all(viewer.shown[1][0] <= traces[-1][0].max())
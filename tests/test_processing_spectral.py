@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Created the 18/10/2026
+"""
+import numpy as np
+import pytest
+
+from pymodaq_data.data import Axis, DataRaw
+
+from pymodaq_plugins_teaching.processing.spectral import FFTMagnitude, WelchPSD, WINDOWS
+
+
+def make_signal(npts=1000, delta_t=1e-3, frequency=50.):
+    time = np.arange(npts) * delta_t
+    return DataRaw('signal', data=[np.sin(2 * np.pi * frequency * time)],
+                   axes=[Axis('Time', units='s', data=time, index=0)])
+
+
+def test_fft_magnitude():
+    fft = FFTMagnitude()
+    dwa_fft = fft.process(make_signal())
+    omega = dwa_fft.get_axis_from_index(0)[0].get_data()
+    assert dwa_fft.shape == (501,)
+    assert dwa_fft.axes[0].units == 'rad/s'
+    assert omega[np.argmax(dwa_fft[0])] == pytest.approx(2 * np.pi * 50)
+    assert np.allclose(dwa_fft[0], np.abs(np.fft.fft(make_signal()[0]))[:501])
+
+
+def test_fft_magnitude_cache():
+    fft = FFTMagnitude()
+    axis = fft.process(make_signal()).axes[0]
+    assert fft.process(make_signal(frequency=20.)).axes[0] is axis
+    assert fft.process(make_signal(npts=200)).axes[0] is not axis
+
+
+def test_fft_magnitude_ownership():
+    fft = FFTMagnitude()
+    first = fft.process(make_signal())[0]
+    reference = first.copy()
+    for _ in range(5):
+        fft.process(make_signal(frequency=20.))
+    assert np.array_equal(first, reference)
+
+
+@pytest.mark.parametrize('window', WINDOWS)
+def test_welch_psd_white_noise(window):
+    rng = np.random.default_rng(0)
+    npts, delta_t, sigma = 100000, 1e-3, 0.1
+    noise = DataRaw('noise', data=[sigma * rng.standard_normal(npts)], units='V',
+                    axes=[Axis('Time', units='s', data=np.arange(npts) * delta_t, index=0)])
+    psd = WelchPSD(window=window, segment_length=256).process(noise)
+    frequency = psd.get_axis_from_index(0)[0]
+    assert psd.shape == (129,)
+    assert frequency.units == 'Hz'
+    assert frequency.get_data()[-1] == pytest.approx(0.5 / delta_t)
+    # one sided white noise density, and Parseval
+    assert np.median(psd[0][1:-1]) == pytest.approx(2 * sigma ** 2 * delta_t, rel=0.1)
+    assert np.sum(psd[0]) / (256 * delta_t) == pytest.approx(sigma ** 2, rel=0.05)
+
+
+def test_welch_psd_averaging():
+    rng = np.random.default_rng(0)
+    psd = WelchPSD(segment_length=128, overlap=0., n_averaging=4)
+    fluctuations = []
+    for _ in range(8):
+        noisy = make_signal(npts=1024)
+        noisy.data[0] += rng.standard_normal(1024)
+        fluctuations.append(np.std(psd.process(noisy)[0][40:]))
+    assert fluctuations[-1] < fluctuations[0]
+    assert np.argmax(psd.process(make_signal(npts=1024))[0]) == round(50 * 128 * 1e-3)
+
+    psd.segment_length = 64
+    assert psd.process(make_signal(npts=1024)).shape == (33,)
+    with pytest.raises(ValueError):
+        psd.overlap = 1.
+    with pytest.raises(ValueError):
+        psd.window = 'unknown'
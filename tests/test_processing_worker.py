@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Created the 18/10/2026
+"""
+import threading
+import time
+
+from pymodaq_plugins_teaching.processing.worker import AnalysisWorker
+
+
+def test_analysis_worker_drops_oldest():
+    started = threading.Event()
+    release = threading.Event()
+    processed = []
+
+    def process(data):
+        started.set()
+        release.wait(2)
+        processed.append(data)
+        return data * 10
+
+    worker = AnalysisWorker(process, maxsize=2)
+    worker.submit(0)
+    assert started.wait(1)
+    for data in range(1, 6):  # submitted while 0 is being processed
+        worker.submit(data)
+    release.set()
+    t0 = time.perf_counter()
+    while len(processed) < 3 and time.perf_counter() - t0 < 2:
+        time.sleep(0.01)
+    worker.stop(1)
+
+    assert processed == [0, 4, 5]
+    assert worker.n_dropped == 3
+    assert worker.take_result() == 50
+    assert worker.take_result() is None
+
+
+def test_analysis_worker_error():
+    worker = AnalysisWorker(lambda data: 1 / data)
+    worker.submit(0)
+    worker.submit(2)
+    t0 = time.perf_counter()
+    result = None
+    while result is None and time.perf_counter() - t0 < 2:
+        time.sleep(0.01)
+        result = worker.take_result()
+    worker.stop(1)
+    assert result == 0.5